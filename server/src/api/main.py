@@ -95,6 +95,9 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down Research Paper Reference Agent API")
+    
+    if enhanced_parser is not None:
+        await enhanced_parser.doi_extractor.aclose()
 
 
 app = FastAPI(
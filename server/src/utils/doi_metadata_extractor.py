@@ -4,7 +4,7 @@ DOI Metadata Extractor - Comprehensive DOI-based metadata retrieval
 import re
 import httpx
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from loguru import logger
 from urllib.parse import urlparse
 
@@ -18,6 +18,9 @@ class DOIMetadataExtractor:
         self.crossref_client = None
         self.openalex_client = None
         self.unpaywall_client = None
+        # Shared HTTP client so the connection pool (TCP/TLS sessions, DNS)
+        # survives across lookups; created lazily inside the running loop
+        self._http_client: Optional[httpx.AsyncClient] = None
         self._initialize_clients()
     
     def _initialize_clients(self):
@@ -30,6 +33,21 @@ class DOIMetadataExtractor:
         except Exception as e:
             logger.warning(f"Failed to initialize some clients: {e}")
     
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+            )
+        return self._http_client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     def normalize_doi(self, doi: str) -> str:
         """Normalize DOI: strip spaces, ensure lowercase, prepend https://doi.org/ if missing"""
         if not doi:
@@ -70,39 +88,56 @@ class DOIMetadataExtractor:
             ("Unpaywall", self._extract_from_unpaywall),
         ]
         
-        for api_name, extract_func in apis_to_try:
-            try:
-                metadata = await extract_func(normalized_doi)
+        # Query all APIs concurrently, but keep the priority order when picking
+        # a result: the first successful API in the list wins and the
+        # remaining lookups are cancelled.
+        tasks = [
+            asyncio.create_task(self._extract_one(api_name, extract_func, normalized_doi))
+            for api_name, extract_func in apis_to_try
+        ]
+        
+        try:
+            for task in tasks:
+                api_name, metadata = await task
                 if metadata and not metadata.get("error"):
                     metadata["source_api"] = api_name
                     metadata["doi_url"] = self.get_doi_url(normalized_doi)
                     return metadata
-            except Exception as e:
-                logger.warning(f"{api_name} API failed: {str(e)}")
-                continue
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
         
         return {"error": "Metadata not found for DOI"}
     
+    async def _extract_one(self, api_name: str, extract_func, doi: str) -> Tuple[str, Dict[str, Any]]:
+        """Run a single API lookup, returning (api_name, metadata)"""
+        try:
+            return api_name, await extract_func(doi)
+        except Exception as e:
+            logger.warning(f"{api_name} API failed: {str(e)}")
+            return api_name, {}
+    
     async def _extract_from_crossref(self, doi: str) -> Dict[str, Any]:
         """Extract metadata from CrossRef API"""
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"https://api.crossref.org/works/{doi}"
-                headers = {
-                    "User-Agent": "ResearchPaperAgent/1.0 (mailto:user@example.com)",
-                    "Accept": "application/json"
-                }
-                
-                response = await client.get(url, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                data = response.json()
-                
-                if "message" not in data:
-                    return {"error": "No message in CrossRef response"}
-                
-                item = data["message"]
-                return self._parse_crossref_metadata(item)
-                
+            client = self._get_http_client()
+            url = f"https://api.crossref.org/works/{doi}"
+            headers = {
+                "User-Agent": "ResearchPaperAgent/1.0 (mailto:user@example.com)",
+                "Accept": "application/json"
+            }
+            
+            response = await client.get(url, headers=headers, timeout=30.0)
+            response.raise_for_status()
+            data = response.json()
+            
+            if "message" not in data:
+                return {"error": "No message in CrossRef response"}
+            
+            item = data["message"]
+            return self._parse_crossref_metadata(item)
+            
         except Exception as e:
             logger.error(f"CrossRef API error: {str(e)}")
             return {"error": str(e)}
@@ -110,19 +145,19 @@ class DOIMetadataExtractor:
     async def _extract_from_openalex(self, doi: str) -> Dict[str, Any]:
         """Extract metadata from OpenAlex API"""
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"https://api.openalex.org/works/doi:{doi}"
-                headers = {
-                    "User-Agent": "ResearchPaperAgent/1.0 (mailto:user@example.com)",
-                    "Accept": "application/json"
-                }
-                
-                response = await client.get(url, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                data = response.json()
-                
-                return self._parse_openalex_metadata(data)
-                
+            client = self._get_http_client()
+            url = f"https://api.openalex.org/works/doi:{doi}"
+            headers = {
+                "User-Agent": "ResearchPaperAgent/1.0 (mailto:user@example.com)",
+                "Accept": "application/json"
+            }
+            
+            response = await client.get(url, headers=headers, timeout=30.0)
+            response.raise_for_status()
+            data = response.json()
+            
+            return self._parse_openalex_metadata(data)
+            
         except Exception as e:
             logger.error(f"OpenAlex API error: {str(e)}")
             return {"error": str(e)}
@@ -136,20 +171,20 @@ class DOIMetadataExtractor:
                 logger.info("Unpaywall email not configured, skipping")
                 return {"error": "Unpaywall email not configured"}
             
-            async with httpx.AsyncClient() as client:
-                url = f"https://api.unpaywall.org/v2/{doi}"
-                params = {"email": email}
-                headers = {
-                    "User-Agent": "ResearchPaperAgent/1.0 (mailto:user@example.com)",
-                    "Accept": "application/json"
-                }
-                
-                response = await client.get(url, headers=headers, params=params, timeout=30.0)
-                response.raise_for_status()
-                data = response.json()
-                
-                return self._parse_unpaywall_metadata(data)
-                
+            client = self._get_http_client()
+            url = f"https://api.unpaywall.org/v2/{doi}"
+            params = {"email": email}
+            headers = {
+                "User-Agent": "ResearchPaperAgent/1.0 (mailto:user@example.com)",
+                "Accept": "application/json"
+            }
+            
+            response = await client.get(url, headers=headers, params=params, timeout=30.0)
+            response.raise_for_status()
+            data = response.json()
+            
+            return self._parse_unpaywall_metadata(data)
+            
         except Exception as e:
             logger.error(f"Unpaywall API error: {str(e)}")
             return {"error": str(e)}
@@ -700,21 +735,13 @@ class DOIMetadataConflictDetector:
         if not authors1 or not authors2:
             return 0.0
         
-        # Normalize author names
-        authors1_norm = [author.lower().strip() for author in authors1]
-        authors2_norm = [author.lower().strip() for author in authors2]
-        
-        # Calculate overlap
-        set1 = set(authors1_norm)
-        set2 = set(authors2_norm)
-        
-        if not set1 or not set2:
-            return 0.0
+        # Normalize author names straight into sets
+        set1 = {author.lower().strip() for author in authors1}
+        set2 = {author.lower().strip() for author in authors2}
         
+        # Jaccard overlap; union size via inclusion-exclusion
         intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        
-        return intersection / union if union > 0 else 0.0
+        return intersection / (len(set1) + len(set2) - intersection)
     
     def _calculate_confidence_scores(
         self, 
@@ -3,6 +3,7 @@ Fixed enhanced reference parser that correctly handles the reference format
 """
 import asyncio
 import re
+from datetime import date
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
@@ -17,6 +18,30 @@ from .reference_classifier import ReferenceTypeClassifier
 from ..models.reference_models import ReferenceType
 from .safe_string_utils import safe_strip, is_valid_doi, looks_like_article_number
 
+# Plausible publication years; next year is allowed for in-press articles.
+# Computed once at import instead of a hardcoded upper bound that goes stale.
+_MIN_YEAR = 1900
+_MAX_YEAR = date.today().year + 1
+
+# Title-first formats, anchored and used with .match(). Groups: title, authors, journal, year.
+# "Title, Author1, Author2, Journal (Year)"
+_TITLE_FIRST_PAREN_PATTERN = re.compile(
+    r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z]+(?:\s+[A-Z]+)*)\s*\((\d{4})\)'
+)
+# "Title, Author1, Author2, Journal, Year" (optionally followed by vol. X, no. Y, pp. Z)
+_TITLE_FIRST_COMMA_PATTERN = re.compile(
+    r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
+)
+_TITLE_FIRST_YEAR_PATTERNS = (_TITLE_FIRST_PAREN_PATTERN, _TITLE_FIRST_COMMA_PATTERN)
+
+# Fallback year patterns, most specific first. The 19xx/20xx alternation is
+# non-capturing so the whole 4-digit year is returned, not just "19"/"20".
+_YEAR_PATTERNS = [
+    re.compile(r'\b(?:19|20)\d{2}\b'),  # 4-digit year
+    re.compile(r'\((\d{4})\)'),       # Year in parentheses
+    re.compile(r'(\d{4})'),           # Any 4-digit number
+]
+
 
 class EnhancedReferenceParser:
     """Enhanced parser that combines local parsing with API client enrichment"""
@@ -341,8 +366,7 @@ class EnhancedReferenceParser:
         
         # Strategy 2: Handle title-first format
         # Pattern: "Title, Author1, Author2, Journal (Year)"
-        title_first_pattern = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z]+(?:\s+[A-Z]+)*)\s*\((\d{4})\)'
-        title_first_match = re.match(title_first_pattern, text)
+        title_first_match = _TITLE_FIRST_PAREN_PATTERN.match(text)
         
         if title_first_match:
             title = title_first_match.group(1).strip()
@@ -352,9 +376,8 @@ class EnhancedReferenceParser:
                 return title
         
         # Strategy 2b: Handle title-first format without parentheses
-        # Pattern: "Title, Author1, Author2, Journal, Year"
-        title_first_no_parens = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
-        title_first_no_parens_match = re.match(title_first_no_parens, text)
+        # Pattern: "Title, Author1, Author2, Journal, Year[, vol. X, no. Y, pp. Z]"
+        title_first_no_parens_match = _TITLE_FIRST_COMMA_PATTERN.match(text)
         
         if title_first_no_parens_match:
             title = title_first_no_parens_match.group(1).strip()
@@ -363,18 +386,6 @@ class EnhancedReferenceParser:
             if len(title) > 15:
                 return title
         
-        # Strategy 2c: Handle title-first format with additional fields
-        # Pattern: "Title, Author1, Author2, Journal, Year, vol. X, no. Y, pp. Z"
-        title_first_complex = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
-        title_first_complex_match = re.match(title_first_complex, text)
-        
-        if title_first_complex_match:
-            title = title_first_complex_match.group(1).strip()
-            # Clean up the title - remove any trailing punctuation
-            title = re.sub(r'[.,\s]+$', '', title)
-            if len(title) > 15:
-                return title
-        
         # Strategy 2d: Handle title-first format by looking for the first long capitalized phrase
         # This is a more flexible approach for complex references
         words = text.split(',')
@@ -530,8 +541,7 @@ class EnhancedReferenceParser:
         
         # Strategy 2: Handle title-first format
         # Pattern: "Title, Author1, Author2, Journal (Year)"
-        title_first_pattern = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z]+(?:\s+[A-Z]+)*)\s*\((\d{4})\)'
-        title_first_match = re.match(title_first_pattern, text)
+        title_first_match = _TITLE_FIRST_PAREN_PATTERN.match(text)
         
         if title_first_match:
             journal = title_first_match.group(3).strip()
@@ -541,9 +551,8 @@ class EnhancedReferenceParser:
                 return journal
         
         # Strategy 2b: Handle title-first format without parentheses
-        # Pattern: "Title, Author1, Author2, Journal, Year"
-        title_first_no_parens = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
-        title_first_no_parens_match = re.match(title_first_no_parens, text)
+        # Pattern: "Title, Author1, Author2, Journal, Year[, vol. X, no. Y, pp. Z]"
+        title_first_no_parens_match = _TITLE_FIRST_COMMA_PATTERN.match(text)
         
         if title_first_no_parens_match:
             journal = title_first_no_parens_match.group(3).strip()
@@ -552,18 +561,6 @@ class EnhancedReferenceParser:
             if len(journal) > 2:
                 return journal
         
-        # Strategy 2c: Handle title-first format with additional fields
-        # Pattern: "Title, Author1, Author2, Journal, Year, vol. X, no. Y, pp. Z"
-        title_first_complex = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
-        title_first_complex_match = re.match(title_first_complex, text)
-        
-        if title_first_complex_match:
-            journal = title_first_complex_match.group(3).strip()
-            # Clean up the journal name
-            journal = re.sub(r'[.,\s]+$', '', journal)
-            if len(journal) > 2:
-                return journal
-        
         # Strategy 2d: Handle title-first format by looking for the first long capitalized phrase
         # This is a more flexible approach for complex references
         words = text.split(',')
@@ -633,8 +630,7 @@ class EnhancedReferenceParser:
         
         # First, try to identify if this is a "title-first" format
         # Look for a long capitalized phrase at the beginning (likely title)
-        title_first_pattern = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z]+(?:\s+[A-Z]+)*)\s*\((\d{4})\)'
-        title_first_match = re.match(title_first_pattern, text)
+        title_first_match = _TITLE_FIRST_PAREN_PATTERN.match(text)
         
         if title_first_match:
             # This is title-first format: "Title, Author1, Author2, Journal (Year)"
@@ -670,9 +666,8 @@ class EnhancedReferenceParser:
             return authors
         
         # Handle title-first format without parentheses
-        # Pattern: "Title, Author1, Author2, Journal, Year"
-        title_first_no_parens = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
-        title_first_no_parens_match = re.match(title_first_no_parens, text)
+        # Pattern: "Title, Author1, Author2, Journal, Year[, vol. X, no. Y, pp. Z]"
+        title_first_no_parens_match = _TITLE_FIRST_COMMA_PATTERN.match(text)
         
         if title_first_no_parens_match:
             # This is title-first format: "Title, Author1, Author2, Journal, Year"
@@ -707,44 +702,6 @@ class EnhancedReferenceParser:
             
             return authors
         
-        # Handle title-first format with additional fields
-        # Pattern: "Title, Author1, Author2, Journal, Year, vol. X, no. Y, pp. Z"
-        title_first_complex = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
-        title_first_complex_match = re.match(title_first_complex, text)
-        
-        if title_first_complex_match:
-            # This is title-first format: "Title, Author1, Author2, Journal, Year, ..."
-            authors_text = title_first_complex_match.group(2).strip()
-            
-            # Split authors by comma
-            author_parts = [part.strip() for part in authors_text.split(',') if part.strip()]
-            
-            # Filter out common non-author words that might appear in the author list
-            non_author_words = {'blockchain', 'ieee', 'journal', 'proceedings', 'conference', 'symposium', 'vol', 'volume', 'pp', 'pages', 'security', 'hackers'}
-            
-            for author_part in author_parts:
-                # Skip if it's a common non-author word
-                if author_part.lower() in non_author_words:
-                    continue
-                    
-                # For single names like "Johnson"
-                if len(author_part.split()) == 1:
-                    authors.append({
-                        "surname": author_part,
-                        "given": ""
-                    })
-                else:
-                    # For multi-word names, treat the last word as surname
-                    words = author_part.split()
-                    surname = words[-1]
-                    given = ' '.join(words[:-1])
-                    authors.append({
-                        "surname": surname,
-                        "given": given
-                    })
-            
-            return authors
-        
         # Handle title-first format by looking for the first long capitalized phrase
         # This is a more flexible approach for complex references
         words = text.split(',')
@@ -836,50 +793,21 @@ class EnhancedReferenceParser:
     
     def _extract_year_enhanced(self, text: str) -> Optional[str]:
         """Enhanced year extraction"""
-        import re
-        
-        # Strategy 1: Handle title-first format
-        # Pattern: "Title, Author1, Author2, Journal (Year)"
-        title_first_pattern = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z]+(?:\s+[A-Z]+)*)\s*\((\d{4})\)'
-        title_first_match = re.match(title_first_pattern, text)
-        
-        if title_first_match:
-            year = title_first_match.group(4).strip()
-            if year and year.isdigit() and 1900 <= int(year) <= 2030:
-                return year
-        
-        # Strategy 1b: Handle title-first format without parentheses
-        # Pattern: "Title, Author1, Author2, Journal, Year"
-        title_first_no_parens = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
-        title_first_no_parens_match = re.match(title_first_no_parens, text)
-        
-        if title_first_no_parens_match:
-            year = title_first_no_parens_match.group(4).strip()
-            if year and year.isdigit() and 1900 <= int(year) <= 2030:
-                return year
-        
-        # Strategy 1c: Handle title-first format with additional fields
-        # Pattern: "Title, Author1, Author2, Journal, Year, vol. X, no. Y, pp. Z"
-        title_first_complex = r'^([A-Z][^,]{20,}),\s*([^,]+(?:,\s*[^,]+)*),\s*([A-Z][^,]+),\s*(\d{4})'
-        title_first_complex_match = re.match(title_first_complex, text)
-        
-        if title_first_complex_match:
-            year = title_first_complex_match.group(4).strip()
-            if year and year.isdigit() and 1900 <= int(year) <= 2030:
-                return year
+        # Strategy 1: Handle title-first formats, with the year in parentheses
+        # or as a comma-separated field (optionally followed by vol./no./pp.)
+        for pattern in _TITLE_FIRST_YEAR_PATTERNS:
+            title_first_match = pattern.match(text)
+            if title_first_match:
+                year = title_first_match.group(4).strip()
+                if year and year.isdigit() and _MIN_YEAR <= int(year) <= _MAX_YEAR:
+                    return year
         
         # Strategy 2: Look for year patterns anywhere in the text
-        year_patterns = [
-            r'\b(19|20)\d{2}\b',  # 4-digit year
-            r'\((\d{4})\)',       # Year in parentheses
-            r'(\d{4})',           # Any 4-digit number
-        ]
-        
-        for pattern in year_patterns:
-            match = re.search(pattern, text)
+        for pattern in _YEAR_PATTERNS:
+            match = pattern.search(text)
             if match:
                 year = match.group(1) if match.groups() else match.group(0)
-                if year.isdigit() and 1900 <= int(year) <= 2030:
+                if year.isdigit() and _MIN_YEAR <= int(year) <= _MAX_YEAR:
                     return year
         
         return None
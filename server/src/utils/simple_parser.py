@@ -2,20 +2,64 @@
 Simple reference parser using regex patterns
 """
 import re
+from collections import OrderedDict
+from copy import deepcopy
 from typing import List, Dict, Any, Optional
 from loguru import logger
 from .text_normalizer import text_normalizer
 from .reference_tagging import generate_tagged_output as shared_generate_tagged_output
 from .safe_string_utils import is_valid_doi, looks_like_article_number
 
+# Parsed results kept per reference text (oldest entries evicted first)
+_PARSE_CACHE_SIZE = 1024
+
+# Patterns used on every parsed reference, compiled once at import time
+_YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+_DOI_PATTERN = re.compile(r'10\.\d+/[^\s,)]+')
+_PAGES_PATTERNS = [
+    re.compile(r'pp\.?\s*(\d+(?:[-–]\d+)?)'),  # pp. 123-456
+    re.compile(r'p\.?\s*(\d+(?:[-–]\d+)?)'),   # p. 123-456
+    re.compile(r'(\d+(?:[-–]\d+)?)\s*$'),      # 123-456 at end
+    re.compile(r'(\d+(?:[-–]\d+)?)(?=\s*[,\.])'),  # 123-456 before comma/period
+]
+_AUTHOR_PATTERN_START = re.compile(r'^(?:^|\s)([A-Z][a-z]{3,}),\s*([A-Z]\.(?:\s*[A-Z]\.)*)(?=\s)')
+_AUTHOR_PATTERN_YEAR = re.compile(r'([A-Z][a-z]{3,}),\s*([A-Z]\.)\s*[\(]?(19|20)\d{2}')
+_AUTHOR_PATTERN_MULTI = re.compile(r'([A-Z][a-z]{3,}),\s*([A-Z]\.)(?:\s*[,.]?\s*([A-Z][a-z]{3,}),\s*([A-Z]\.))')
+_QUOTED_TITLE_PATTERN = re.compile(r'"([^"]+)"')
+_LEADING_PUNCT_PATTERN = re.compile(r'^[.,\s]+')
+_TRAILING_PUNCT_PATTERN = re.compile(r'[.,\s]+$')
+# Journal-name word runs are bounded (at most 32 capitalised words, well past any
+# real venue name) so a long run of capitalised words without a trailing year
+# cannot cause quadratic backtracking on large reference blobs.
+_JOURNAL_PATTERNS = [
+    re.compile(r'In:\s*([^,]+)'),  # "In: Conference Name"
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,31})\s+\d{4}'),  # Journal Name 2020
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,31})\s*\.\s*\d{4}'),  # Journal Name. 2020
+]
+_JOURNAL_TRAILING_PUNCT_PATTERN = re.compile(r'[.,;]$')
+
 
 class SimpleReferenceParser:
     """Simple but powerful reference parser using regex patterns"""
     
     def __init__(self):
+        self._parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         logger.info("Simple reference parser initialized")
     
     def parse_reference(self, ref_text: str) -> Dict[str, Any]:
+        """Parse reference text and extract key fields (cached per reference text)"""
+        cached = self._parse_cache.get(ref_text)
+        if cached is not None:
+            self._parse_cache.move_to_end(ref_text)
+            return deepcopy(cached)
+        
+        result = self._parse_reference_uncached(ref_text)
+        self._parse_cache[ref_text] = deepcopy(result)
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return result
+    
+    def _parse_reference_uncached(self, ref_text: str) -> Dict[str, Any]:
         """Parse reference text and extract key fields"""
         result = {
             "family_names": [],
@@ -32,12 +76,12 @@ class SimpleReferenceParser:
         text = text_normalizer.normalize_text(ref_text, preserve_case=True).strip()
         
         # Extract year
-        year_match = re.search(r'\b(19|20)\d{2}\b', text)
+        year_match = _YEAR_PATTERN.search(text)
         if year_match:
             result["year"] = year_match.group()
         
         # Extract DOI with STRICT VALIDATION
-        doi_match = re.search(r'10\.\d+/[^\s,)]+', text)
+        doi_match = _DOI_PATTERN.search(text)
         if doi_match:
             candidate_doi = doi_match.group()
             # STRICT VALIDATION: Check if it's a valid DOI
@@ -53,15 +97,8 @@ class SimpleReferenceParser:
                 result["doi"] = None
         
         # Extract pages (various formats)
-        pages_patterns = [
-            r'pp\.?\s*(\d+(?:[-–]\d+)?)',  # pp. 123-456
-            r'p\.?\s*(\d+(?:[-–]\d+)?)',   # p. 123-456
-            r'(\d+(?:[-–]\d+)?)\s*$',      # 123-456 at end
-            r'(\d+(?:[-–]\d+)?)(?=\s*[,\.])',  # 123-456 before comma/period
-        ]
-        
-        for pattern in pages_patterns:
-            pages_match = re.search(pattern, text)
+        for pattern in _PAGES_PATTERNS:
+            pages_match = pattern.search(text)
             if pages_match:
                 result["pages"] = pages_match.group(1)
                 break
@@ -89,8 +126,7 @@ class SimpleReferenceParser:
         authors = []
         
         # Strategy 1: Very strict academic format at the beginning of reference
-        pattern1 = r'^(?:^|\s)([A-Z][a-z]{3,}),\s*([A-Z]\.(?:\s*[A-Z]\.)*)(?=\s)'
-        matches1 = re.findall(pattern1, text)
+        matches1 = _AUTHOR_PATTERN_START.findall(text)
         
         for surname, given in matches1:
             # Very strict validation
@@ -103,8 +139,7 @@ class SimpleReferenceParser:
         # Strategy 2: Look for author patterns with year context (very conservative)
         if not authors:
             # Pattern: "Author, F. (Year)" or "Author, F. Year" - very specific
-            pattern2 = r'([A-Z][a-z]{3,}),\s*([A-Z]\.)\s*[\(]?(19|20)\d{2}'
-            matches2 = re.findall(pattern2, text)
+            matches2 = _AUTHOR_PATTERN_YEAR.findall(text)
             
             for surname, given, year in matches2:
                 if self._is_definitely_author(surname, given, text):
@@ -116,8 +151,7 @@ class SimpleReferenceParser:
         # Strategy 3: Look for multiple authors pattern (very conservative)
         if not authors:
             # Pattern: "Author1, F., Author2, F." - must have multiple authors
-            pattern3 = r'([A-Z][a-z]{3,}),\s*([A-Z]\.)(?:\s*[,.]?\s*([A-Z][a-z]{3,}),\s*([A-Z]\.))'
-            match3 = re.search(pattern3, text)
+            match3 = _AUTHOR_PATTERN_MULTI.search(text)
             if match3:
                 surname1, given1, surname2, given2 = match3.groups()
                 if self._is_definitely_author(surname1, given1, text):
@@ -179,21 +213,16 @@ class SimpleReferenceParser:
     
     def _appears_in_title_context(self, surname: str, title_section: str) -> bool:
         """Check if a surname appears in title-like context"""
-        import re
-        
-        # Look for patterns where the surname is part of a title phrase
-        title_context_patterns = [
-            r'[A-Z][a-z]*\s+' + re.escape(surname) + r'\s+[A-Z][a-z]*',  # Word Surname Word
-            r'[A-Z][a-z]*\s+' + re.escape(surname) + r'[,:]',  # Word Surname, or Word Surname:
-            r':\s*[A-Z][a-z]*\s+' + re.escape(surname),  # : Word Surname
-            r'[A-Z][a-z]*\s+' + re.escape(surname) + r'\s+[A-Z][a-z]*\s+[A-Z]',  # Word Surname Word Word
-        ]
-        
-        for pattern in title_context_patterns:
-            if re.search(pattern, title_section, re.IGNORECASE):
-                return True
-        
-        return False
+        escaped = re.escape(surname)
+        # Single alternation over the title-phrase contexts:
+        #   Word Surname Word (also covers Word Surname Word Word),
+        #   Word Surname, / Word Surname: and : Word Surname
+        title_context_pattern = (
+            r'[A-Z][a-z]*\s+' + escaped + r'(?:\s+[A-Z][a-z]*|[,:])'
+            r'|:\s*[A-Z][a-z]*\s+' + escaped
+        )
+        
+        return re.search(title_context_pattern, title_section, re.IGNORECASE) is not None
     
     def _looks_like_real_surname(self, surname: str) -> bool:
         """Check if a word looks like a real surname"""
@@ -259,7 +288,7 @@ class SimpleReferenceParser:
         filtered_authors = []
         
         # Extract potential title section (before year or journal indicators)
-        year_match = re.search(r'\b(19|20)\d{2}\b', full_text)
+        year_match = _YEAR_PATTERN.search(full_text)
         title_section = full_text[:year_match.start()] if year_match else full_text
         
         for author in authors:
@@ -278,14 +307,16 @@ class SimpleReferenceParser:
         # Remove author patterns first
         clean_text = text
         
-        # Remove author patterns
-        for author in authors:
-            # Remove "Surname, Given" pattern
-            author_pattern = f"{author['surname']},?\\s*{author['given']}"
+        # Remove all "Surname, Given" patterns in a single pass
+        if authors:
+            author_pattern = '|'.join(
+                f"{re.escape(author['surname'])},?\\s*{re.escape(author['given'])}"
+                for author in authors
+            )
             clean_text = re.sub(author_pattern, '', clean_text, flags=re.IGNORECASE)
         
         # Look for title in quotes
-        title_in_quotes = re.search(r'"([^"]+)"', clean_text)
+        title_in_quotes = _QUOTED_TITLE_PATTERN.search(clean_text)
         if title_in_quotes:
             return title_in_quotes.group(1).strip()
         
@@ -294,15 +325,15 @@ class SimpleReferenceParser:
         year_pos = text.find(authors[0]["surname"]) if authors else 0
         if year_pos > 0:
             # Find text between authors and year
-            year_match = re.search(r'\b(19|20)\d{2}\b', text)
+            year_match = _YEAR_PATTERN.search(text)
             if year_match:
                 start_pos = year_pos + len(authors[0]["surname"])
                 end_pos = year_match.start()
                 potential_title = text[start_pos:end_pos].strip()
                 
                 # Clean up the potential title
-                potential_title = re.sub(r'^[.,\s]+', '', potential_title)
-                potential_title = re.sub(r'[.,\s]+$', '', potential_title)
+                potential_title = _LEADING_PUNCT_PATTERN.sub('', potential_title)
+                potential_title = _TRAILING_PUNCT_PATTERN.sub('', potential_title)
                 
                 # Check if it looks like a title (has reasonable length and words)
                 if len(potential_title) > 10 and len(potential_title.split()) > 2:
@@ -316,18 +347,12 @@ class SimpleReferenceParser:
         # This is a simplified approach - in real PDFs, formatting info is lost
         
         # Common journal patterns
-        journal_patterns = [
-            r'In:\s*([^,]+)',  # "In: Conference Name"
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\d{4}',  # Journal Name 2020
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*\.\s*\d{4}',  # Journal Name. 2020
-        ]
-        
-        for pattern in journal_patterns:
-            match = re.search(pattern, text)
+        for pattern in _JOURNAL_PATTERNS:
+            match = pattern.search(text)
             if match:
                 journal = match.group(1).strip()
                 # Clean up
-                journal = re.sub(r'[.,;]$', '', journal)
+                journal = _JOURNAL_TRAILING_PUNCT_PATTERN.sub('', journal)
                 if len(journal) > 3:  # Reasonable journal name length
                     return journal
         
@@ -2,6 +2,7 @@
 Smart API strategy for optimized reference enrichment
 """
 import asyncio
+from datetime import date
 from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 from dataclasses import dataclass
@@ -14,6 +15,10 @@ from .text_normalizer import text_normalizer
 from .mandatory_api_selector import MandatoryAPISelector
 from ..models.reference_models import ReferenceType
 
+# Latest plausible publication year (next year allowed for in-press articles),
+# computed once at import rather than hardcoded
+_MAX_YEAR = date.today().year + 1
+
 
 @dataclass
 class APIResult:
@@ -38,6 +43,24 @@ class QualityMetrics:
 class SmartAPIStrategy:
     """Smart API strategy with priority ordering and early exit"""
     
+    # Fields merged from an API result (full merge / fill-missing modes)
+    _MERGE_FIELDS = ("title", "year", "journal", "doi", "pages", "publisher", "url", "abstract", "volume", "issue", "issue_month")
+    # Non-critical fields filled in on a medium-confidence match
+    _CONSERVATIVE_MERGE_FIELDS = ("doi", "url", "pages", "publisher", "abstract")
+    # Quality weights for the graded core fields
+    _TITLE_WEIGHT = 0.35     # Most important - identifies the work
+    _AUTHORS_WEIGHT = 0.25   # High importance - identifies creators
+    _YEAR_WEIGHT = 0.15      # Important for validation
+    _JOURNAL_WEIGHT = 0.15   # Important for context
+    # Presence-only bonus fields: (field, quality when present, weight)
+    _BONUS_FIELD_WEIGHTS = (
+        ("doi", 1.0, 0.05),
+        ("pages", 0.8, 0.02),
+        ("publisher", 0.7, 0.015),
+        ("url", 0.6, 0.01),
+        ("abstract", 0.5, 0.005),
+    )
+    
     def __init__(self):
         self.crossref_client = CrossRefClient()
         self.openalex_client = OpenAlexClient()
@@ -242,7 +265,6 @@ class SmartAPIStrategy:
             
             # Calculate final quality
             try:
-                current_quality = self._calculate_data_quality(enriched_ref)
                 final_quality = self._calculate_data_quality(enriched_ref)
                 final_author_analysis = self._analyze_authors(enriched_ref)
                 
@@ -358,9 +380,9 @@ class SmartAPIStrategy:
         if year:
             try:
                 year_int = int(str(year))
-                if 1800 <= year_int <= 2030:
+                if 1800 <= year_int <= _MAX_YEAR:
                     year_quality = 1.0
-                elif 1700 <= year_int <= 2040:
+                elif 1700 <= year_int <= _MAX_YEAR + 10:
                     year_quality = 0.8
             except (ValueError, TypeError):
                 year_quality = 0.0
@@ -386,46 +408,18 @@ class SmartAPIStrategy:
             elif journal_len > 3:
                 journal_quality = 0.4
         
-        # DOI gives significant bonus points
-        doi_quality = 1.0 if parsed_ref.get("doi") else 0.0
-        
-        # Pages are nice to have but not critical
-        pages_quality = 0.8 if parsed_ref.get("pages") else 0.0
-        
-        # Publisher gives bonus
-        publisher_quality = 0.7 if parsed_ref.get("publisher") else 0.0
-        
-        # URL gives bonus
-        url_quality = 0.6 if parsed_ref.get("url") else 0.0
-        
-        # Abstract gives bonus
-        abstract_quality = 0.5 if parsed_ref.get("abstract") else 0.0
-        
-        # Updated weights - more balanced and accurate
-        weights = {
-            "title": 0.35,      # Most important - identifies the work
-            "authors": 0.25,    # High importance - identifies creators
-            "year": 0.15,       # Important for validation
-            "journal": 0.15,    # Important for context
-            "doi": 0.05,        # Bonus points
-            "pages": 0.02,      # Nice to have
-            "publisher": 0.015, # Bonus
-            "url": 0.01,        # Bonus
-            "abstract": 0.005   # Bonus
-        }
-        
         overall_confidence = (
-            title_quality * weights["title"] +
-            author_quality * weights["authors"] +
-            year_quality * weights["year"] +
-            journal_quality * weights["journal"] +
-            doi_quality * weights["doi"] +
-            pages_quality * weights["pages"] +
-            publisher_quality * weights["publisher"] +
-            url_quality * weights["url"] +
-            abstract_quality * weights["abstract"]
+            title_quality * self._TITLE_WEIGHT +
+            author_quality * self._AUTHORS_WEIGHT +
+            year_quality * self._YEAR_WEIGHT +
+            journal_quality * self._JOURNAL_WEIGHT
         )
         
+        # DOI, pages, publisher, URL and abstract only add bonus points when present
+        for field, field_quality, weight in self._BONUS_FIELD_WEIGHTS:
+            if parsed_ref.get(field):
+                overall_confidence += field_quality * weight
+        
         # Ensure minimum quality score if we have basic info
         if title_quality > 0.5 and (author_quality > 0.3 or year_quality > 0.5):
             overall_confidence = max(overall_confidence, 0.5)
@@ -437,7 +431,7 @@ class SmartAPIStrategy:
             author_match_ratio=author_quality,
             year_match=bool(year_quality),
             journal_similarity=journal_quality,
-            doi_match=bool(doi_quality),
+            doi_match=bool(parsed_ref.get("doi")),
             overall_confidence=overall_confidence
         )
     
@@ -468,7 +462,7 @@ class SmartAPIStrategy:
         
         # Year issues - conservative threshold
         year = parsed_ref.get("year")
-        if not year or not str(year).isdigit() or int(year) < 1800 or int(year) > 2030:
+        if not year or not str(year).isdigit() or not 1800 <= int(year) <= _MAX_YEAR:
             critical_issues.append("year")
         
         if critical_issues:
@@ -942,6 +936,9 @@ class SmartAPIStrategy:
         if not api_results:
             return None
         
+        # Drop duplicate candidates before the (more expensive) scoring passes
+        api_results = self._dedupe_candidates(api_results)
+        
         # Create blocking key for efficient filtering
         blocking_key = self._create_blocking_key(parsed_ref)
         logger.info(f"Using blocking key: {blocking_key}")
@@ -952,6 +949,17 @@ class SmartAPIStrategy:
         blocking_filter_enabled = True
         blocking_filter_passed_count = 0
         
+        # The parsed title is the same for every candidate - normalize it once
+        parsed_title_norm = text_normalizer.normalize_title(parsed_ref.get("title", ""))
+        # Likewise the parsed surnames: normalize them once, not per candidate
+        parsed_surnames = frozenset(
+            text_normalizer.normalize_text(name) for name in parsed_ref.get("family_names") or []
+        )
+        # Per-reference flags used by the cheap checks that run before title scoring.
+        # Without authors, requirements are relaxed; blocking needs authors and year.
+        has_authors = bool(parsed_ref.get("family_names"))
+        has_sufficient_data = bool(has_authors and parsed_ref.get("year"))
+        
         # First pass: try with blocking filter enabled
         for result in api_results:
             if not hasattr(result, 'title') or not result.title:
@@ -959,7 +967,6 @@ class SmartAPIStrategy:
             
             # Apply blocking filter first (most efficient) - but skip if blocking key is too restrictive
             # Only apply blocking if we have enough data, otherwise allow all candidates through
-            has_sufficient_data = bool(parsed_ref.get("family_names") and parsed_ref.get("year"))
             if has_sufficient_data and blocking_filter_enabled:
                 if not self._passes_blocking_filter(parsed_ref, result, blocking_key):
                     continue
@@ -969,7 +976,6 @@ class SmartAPIStrategy:
             logger.debug(f"Checking candidate {candidates_checked}: title='{result.title[:60]}...'")
             
             # Normalize titles for better comparison
-            parsed_title_norm = text_normalizer.normalize_title(parsed_ref.get("title", ""))
             result_title_norm = text_normalizer.normalize_title(result.title)
             
             # Calculate title similarity using multiple methods
@@ -979,9 +985,6 @@ class SmartAPIStrategy:
             )
             logger.debug(f"  Title similarity: {title_sim:.2f}")
             
-            # Check if we have authors - if not, relax requirements
-            has_authors = bool(parsed_ref.get("family_names"))
-            
             # PRIORITY: Require very high title similarity first (validate with entire title)
             # This ensures we match the correct paper before considering other factors
             if title_sim < 0.70:
@@ -1004,7 +1007,7 @@ class SmartAPIStrategy:
             # Only check author match if authors exist - make it optional
             author_match_score = 0.0
             if has_authors:
-                author_match_score = self._calculate_author_match_score(parsed_ref, result)
+                author_match_score = self._calculate_author_match_score(parsed_ref, result, parsed_surnames)
                 # Don't reject based on author match - just use score
             else:
                 # No authors in original - don't require author match
@@ -1039,7 +1042,6 @@ class SmartAPIStrategy:
                 logger.debug(f"Checking candidate {candidates_checked} (no blocking filter): title='{result.title[:60]}...'")
                 
                 # Normalize titles for better comparison
-                parsed_title_norm = text_normalizer.normalize_title(parsed_ref.get("title", ""))
                 result_title_norm = text_normalizer.normalize_title(result.title)
                 
                 # Calculate title similarity using multiple methods
@@ -1049,9 +1051,6 @@ class SmartAPIStrategy:
                 )
                 logger.debug(f"  Title similarity: {title_sim:.2f}")
                 
-                # Check if we have authors - if not, relax requirements
-                has_authors = bool(parsed_ref.get("family_names"))
-                
                 # PRIORITY: Require very high title similarity first (validate with entire title)
                 # This ensures we match the correct paper before considering other factors
                 if title_sim < 0.70:
@@ -1074,7 +1073,7 @@ class SmartAPIStrategy:
                 # Only check author match if authors exist - make it optional
                 author_match_score = 0.0
                 if has_authors:
-                    author_match_score = self._calculate_author_match_score(parsed_ref, result)
+                    author_match_score = self._calculate_author_match_score(parsed_ref, result, parsed_surnames)
                 else:
                     # No authors in original - don't require author match
                     author_match_score = 1.0
@@ -1098,6 +1097,22 @@ class SmartAPIStrategy:
         logger.info(f"Checked {candidates_checked} candidates, best match score: {best_score:.2f}")
         return best_match
     
+    def _dedupe_candidates(self, api_results: List[Any]) -> List[Any]:
+        """Remove duplicate candidates, keyed on DOI or normalized title + year"""
+        seen = {}
+        for result in api_results:
+            doi = (getattr(result, 'doi', None) or '').lower()
+            if doi:
+                key = doi
+            else:
+                key = (text_normalizer.normalize_text(getattr(result, 'title', None) or ''), getattr(result, 'year', None))
+            if key not in seen:
+                seen[key] = result
+        
+        if len(seen) < len(api_results):
+            logger.debug(f"Deduplicated candidates: {len(api_results)} → {len(seen)}")
+        return list(seen.values())
+    
     def _create_blocking_key(self, parsed_ref: Dict[str, Any]) -> str:
         """Create blocking key for efficient candidate filtering"""
         return text_normalizer.create_blocking_key(
@@ -1201,18 +1216,13 @@ class SmartAPIStrategy:
                 title1_norm['basic'], title2_norm['basic'], 'jaccard'
             ))
         
-        # No stopwords similarity
+        # No stopwords similarity. Jaccard is already order-independent, so this
+        # also covers the token-sorted key (same token set, same score)
         if title1_norm.get('no_stopwords') and title2_norm.get('no_stopwords'):
             similarities.append(text_normalizer.calculate_similarity(
                 title1_norm['no_stopwords'], title2_norm['no_stopwords'], 'jaccard'
             ))
         
-        # Token-sorted similarity (order-independent)
-        if title1_norm.get('token_sorted') and title2_norm.get('token_sorted'):
-            similarities.append(text_normalizer.calculate_similarity(
-                title1_norm['token_sorted'], title2_norm['token_sorted'], 'jaccard'
-            ))
-        
         # N-gram similarity
         if title1_norm.get('bigrams') and title2_norm.get('bigrams'):
             bigram_sim = len(title1_norm['bigrams'] & title2_norm['bigrams']) / max(
@@ -1222,35 +1232,33 @@ class SmartAPIStrategy:
         
         return max(similarities) if similarities else 0.0
     
-    def _calculate_author_match_score(self, parsed_ref: Dict[str, Any], result: Any) -> float:
+    def _calculate_author_match_score(
+        self, parsed_ref: Dict[str, Any], result: Any, parsed_surnames: Optional[frozenset] = None
+    ) -> float:
         """Calculate detailed author match score"""
         if not parsed_ref.get("family_names") or not hasattr(result, 'authors') or not result.authors:
             return 0.0
         
-        # Normalize original authors
-        original_authors = [text_normalizer.normalize_text(name) for name in parsed_ref["family_names"]]
+        # Normalize original authors (callers scoring many candidates pass them precomputed)
+        original_set = parsed_surnames
+        if original_set is None:
+            original_set = {text_normalizer.normalize_text(name) for name in parsed_ref["family_names"]}
         
         # Extract and normalize result authors
-        result_authors = []
+        result_set = set()
         for author in result.authors:
             if hasattr(author, 'surname') and author.surname:
-                result_authors.append(text_normalizer.normalize_text(author.surname))
+                result_set.add(text_normalizer.normalize_text(author.surname))
             elif hasattr(author, 'full_name') and author.full_name:
                 surname = author.full_name.split()[-1]
-                result_authors.append(text_normalizer.normalize_text(surname))
+                result_set.add(text_normalizer.normalize_text(surname))
         
-        if not result_authors:
+        if not result_set:
             return 0.0
         
-        # Calculate overlap
-        original_set = set(original_authors)
-        result_set = set(result_authors)
-        
+        # Return Jaccard similarity; union size via inclusion-exclusion
         intersection = len(original_set & result_set)
-        union = len(original_set | result_set)
-        
-        # Return Jaccard similarity
-        return intersection / union if union > 0 else 0.0
+        return intersection / (len(original_set) + len(result_set) - intersection)
     
     def _check_domain_whitelist(self, result) -> bool:
         """Check if result passes domain whitelist - disabled for general research support"""
@@ -1332,10 +1340,11 @@ class SmartAPIStrategy:
         
         # Author match
         if original.get("family_names") and api_data.get("family_names"):
-            orig_authors = set(name.lower() for name in original["family_names"])
-            api_authors = set(name.lower() for name in api_data["family_names"])
+            orig_authors = {name.lower() for name in original["family_names"]}
+            api_authors = {name.lower() for name in api_data["family_names"]}
             if orig_authors and api_authors:
-                author_sim = len(orig_authors & api_authors) / len(orig_authors | api_authors)
+                common = len(orig_authors & api_authors)
+                author_sim = common / (len(orig_authors) + len(api_authors) - common)
                 score += author_sim * 0.3
                 total_weight += 0.3
         
@@ -1364,6 +1373,9 @@ class SmartAPIStrategy:
         if not text1 or not text2:
             return 0.0
         
+        if text1 == text2 and not text1.isspace():
+            return 1.0
+        
         words1 = set(text1.lower().split())
         words2 = set(text2.lower().split())
         
@@ -1479,15 +1491,12 @@ class SmartAPIStrategy:
         merged = original.copy()
         merged_fields = []
         
-        # Calculate match score for merge decisions
-        match_score = self._calculate_merge_score(original, api_result)
-        
         # Enhanced logic for filling missing fields AND correcting wrong data
         if fill_missing_fields:
             logger.info(f"🔍 Fill missing fields mode - will fill missing data and correct wrong data")
             
             # For each field, check if we should update
-            for field in ["title", "year", "journal", "doi", "pages", "publisher", "url", "abstract", "volume", "issue", "issue_month"]:
+            for field in self._MERGE_FIELDS:
                 original_value = merged.get(field)
                 api_value = api_result.data.get(field)
                 
@@ -1591,6 +1600,9 @@ class SmartAPIStrategy:
             
             return merged
         
+        # Calculate match score for merge decisions (fill mode above doesn't use it)
+        match_score = self._calculate_merge_score(original, api_result)
+        
         # Apply merge rules based on score
         if match_score < 0.60:
             # No merges allowed
@@ -1600,7 +1612,7 @@ class SmartAPIStrategy:
         elif 0.60 <= match_score < 0.80:
             # Conservative merge: DOI, URL, and non-critical fields
             logger.info(f"Conservative merge (score {match_score:.2f}): DOI/URL and non-critical fields")
-            for field in ["doi", "url", "pages", "publisher", "abstract"]:
+            for field in self._CONSERVATIVE_MERGE_FIELDS:
                 if not merged.get(field) and api_result.data.get(field):
                     merged[field] = api_result.data[field]
                     merged_fields.append(field)
@@ -1609,7 +1621,7 @@ class SmartAPIStrategy:
         elif match_score >= 0.80:
             # Aggressive merge: allow replacing and correcting all fields
             logger.info(f"Aggressive merge (score {match_score:.2f}): full merge and correction allowed")
-            for field in ["title", "year", "journal", "doi", "pages", "publisher", "url", "abstract", "volume", "issue", "issue_month"]:
+            for field in self._MERGE_FIELDS:
                 original_value = merged.get(field)
                 api_value = api_result.data.get(field)
                 
@@ -3,9 +3,34 @@ Advanced text normalization for reference parsing and matching
 """
 import re
 import unicodedata
+from functools import lru_cache
+from sys import intern
 from typing import Dict, List, Set, Tuple
 from loguru import logger
 
+# Only intern short strings (surnames, venue tokens, n-grams); long unique
+# strings such as full titles would just grow the intern table.
+_INTERN_MAX_LEN = 32
+
+# Distinct (text, preserve_case) inputs remembered by normalize_text
+_NORMALIZE_CACHE_SIZE = 4096
+
+# Common problematic characters, built once at import time
+_ENCODING_TRANSLATION = str.maketrans({
+    '\u201c': '"',  # Smart quotes
+    '\u201d': '"',
+    '\u2018': "'",
+    '\u2019': "'",
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\u2026': '...',  # Ellipsis
+})
+
+
+def _intern(text: str) -> str:
+    """Intern short strings so repeated tokens share one object"""
+    return intern(text) if len(text) <= _INTERN_MAX_LEN else text
+
 
 class TextNormalizer:
     """Advanced text normalization for robust matching"""
@@ -38,9 +63,13 @@ class TextNormalizer:
             r'\s+',      # Normalize whitespace
         ]
         
+        # Titles, surnames and venues are normalized repeatedly across parsing,
+        # matching and merging; results are immutable strings, so memoize them
+        self.normalize_text = lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)(self._normalize_text)
+        
         logger.info("Text normalizer initialized")
     
-    def normalize_text(self, text: str, preserve_case: bool = False) -> str:
+    def _normalize_text(self, text: str, preserve_case: bool = False) -> str:
         """Comprehensive text normalization"""
         if not text:
             return ""
@@ -62,7 +91,7 @@ class TextNormalizer:
             if not preserve_case:
                 normalized = normalized.lower()
             
-            return normalized
+            return _intern(normalized)
             
         except Exception as e:
             logger.warning(f"Text normalization failed for '{text}': {e}")
@@ -91,9 +120,9 @@ class TextNormalizer:
         acronyms = self._extract_acronyms(title)
         
         return {
-            'basic': basic,
-            'no_stopwords': no_stopwords,
-            'token_sorted': token_sorted,
+            'basic': _intern(basic),
+            'no_stopwords': _intern(no_stopwords),
+            'token_sorted': _intern(token_sorted),
             'bigrams': bigrams,
             'trigrams': trigrams,
             'acronyms': acronyms,
@@ -140,10 +169,10 @@ class TextNormalizer:
         acronym = self._create_venue_acronym(basic)
         
         return {
-            'basic': basic,
-            'cleaned': cleaned,
-            'key_terms': key_terms,
-            'acronym': acronym,
+            'basic': _intern(basic),
+            'cleaned': _intern(cleaned),
+            'key_terms': _intern(key_terms),
+            'acronym': _intern(acronym),
             'original': venue
         }
     
@@ -181,21 +210,7 @@ class TextNormalizer:
     
     def _fix_encoding_issues(self, text: str) -> str:
         """Fix common encoding issues"""
-        # Replace common problematic characters
-        replacements = {
-            '"': '"',  # Smart quotes
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '–': '-',  # En dash
-            '—': '-',  # Em dash
-            '…': '...',  # Ellipsis
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        return text
+        return text.translate(_ENCODING_TRANSLATION)
     
     def _clean_special_characters(self, text: str) -> str:
         """Clean special characters while preserving important ones"""
@@ -222,7 +237,7 @@ class TextNormalizer:
         
         for i in range(len(words) - n + 1):
             ngram = ' '.join(words[i:i+n])
-            ngrams.add(ngram)
+            ngrams.add(_intern(ngram))
         
         return ngrams
     
@@ -309,6 +324,10 @@ class TextNormalizer:
         if not text1 or not text2:
             return 0.0
         
+        # Identical inputs (often the same interned object) score 1.0 without tokenizing
+        if text1 == text2 and not text1.isspace():
+            return 1.0
+        
         if method == 'jaccard':
             return self._jaccard_similarity(text1, text2)
         elif method == 'token_overlap':
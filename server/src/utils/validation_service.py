@@ -3,12 +3,32 @@ Validation service for enriching references with external API data
 Optimized with parallel processing, caching, and smart validation
 """
 import asyncio
+import hashlib
 import json
 import re
-import requests
-from typing import List, Dict, Any, AsyncGenerator
+from collections import OrderedDict
+from copy import deepcopy
+from itertools import chain, repeat
+from typing import List, Dict, Any, AsyncGenerator, Optional
 from loguru import logger
-# Caching removed as requested
+
+# Enriched parse results kept per reference text (oldest entries evicted first)
+_RESULT_CACHE_SIZE = 10000
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+# Keys whose presence marks a parse result as degraded (never cached)
+_UNCACHEABLE_ERROR_KEYS = ("error", "enrichment_error", "validation_error")
+
+# Per-reference enrichment timeout (seconds), applied once a concurrency slot is held
+_REFERENCE_TIMEOUT = 30.0
+
+# Batches larger than this are sanitized in a worker thread
+_SANITIZE_IN_THREAD_THRESHOLD = 50
+
+# Types passed through unchanged by _sanitize_for_json
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Maximum length of before/after values reported by _track_changes
+_CHANGE_PREVIEW_LENGTH = 100
 
 
 class ValidationService:
@@ -16,52 +36,60 @@ class ValidationService:
     Service for validating and enriching parsed references
     """
     
+    # Field importance weights for validation priority (missing fields add their weight)
+    _PRIORITY_WEIGHTS = (
+        ("doi", 10),
+        ("abstract", 8),
+        ("url", 6),
+        ("publisher", 5),
+        ("journal", 4),
+        ("volume", 2),
+        ("pages", 2),
+    )
+    
+    # Scalar fields compared by _track_changes, in reporting order
+    _FIELDS_TO_CHECK = (
+        "title", "year", "journal", "doi", "pages",
+        "publisher", "url", "volume", "issue"
+    )
+    
     def __init__(self, enhanced_parser):
         self.enhanced_parser = enhanced_parser
         self.max_concurrent = 5  # Max parallel API calls
         self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        # Optional APIs enabled for the current batch (mandatory APIs are auto-selected)
+        self._enabled_optional_apis: Optional[List[str]] = None
+        # Enriched parse results keyed by _cache_key(ref_text, optional_apis)
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    def _cache_key(self, ref_text: str, optional_apis: Optional[List[str]]) -> str:
+        """Build the result cache key from whitespace-normalized text and the enabled optional APIs"""
+        normalized = _WHITESPACE_PATTERN.sub(' ', ref_text).strip()
+        apis = ','.join(sorted(optional_apis)) if optional_apis else ''
+        return hashlib.sha1(f"{apis}\n{normalized}".encode('utf-8'), usedforsecurity=False).hexdigest()
+    
+    def _is_cacheable(self, parsed_ref: Dict[str, Any]) -> bool:
+        """Only fully enriched results without any recorded error are worth reusing"""
+        return bool(parsed_ref.get("api_enrichment_used")) and not any(
+            parsed_ref.get(key) for key in _UNCACHEABLE_ERROR_KEYS
+        )
     
     def needs_validation(self, reference: Dict[str, Any]) -> bool:
         """
         Determine if a reference needs validation/enrichment
         """
-        # Check if critical fields are missing
-        critical_fields = ["doi", "abstract", "url"]
-        missing_critical = sum(1 for field in critical_fields if not reference.get(field))
-        
-        # If missing 2+ critical fields, definitely needs validation
-        if missing_critical >= 2:
-            return True
-        
-        # If missing DOI or abstract, likely needs validation
-        if not reference.get("doi") or not reference.get("abstract"):
-            return True
-        
-        return False
+        # Missing DOI or abstract means it needs validation. This also covers
+        # "2+ of DOI/abstract/URL missing", which always includes one of the two
+        return not (reference.get("doi") and reference.get("abstract"))
     
     def calculate_priority(self, reference: Dict[str, Any]) -> int:
         """
         Calculate priority score for validation (higher = more important)
         """
-        score = 0
-        
-        # Field importance weights
-        weights = {
-            "doi": 10,
-            "abstract": 8,
-            "url": 6,
-            "publisher": 5,
-            "journal": 4,
-            "volume": 2,
-            "pages": 2
-        }
-        
         # Add score for each missing field
-        for field, weight in weights.items():
-            if not reference.get(field):
-                score += weight
-        
-        return score
+        return sum(weight for field, weight in self._PRIORITY_WEIGHTS if not reference.get(field))
     
     async def validate_single_reference(
         self, 
@@ -71,77 +99,116 @@ class ValidationService:
         """
         Validate and enrich a single reference with rate limiting
         """
-        async with self.semaphore:
-            try:
-                # Parse with enrichment (no caching)
-                ref_text = reference.get("original_text", "")
-                if not ref_text:
-                    return reference
-                
-                logger.info(f"🔍 Validating reference {index}: {ref_text[:60]}...")
-                
-                # Parse with enrichment (mandatory APIs auto-selected, optional APIs user-controlled)
-                parsed_ref = await self.enhanced_parser.parse_reference_enhanced(
-                    ref_text,
-                    enable_api_enrichment=True,
-                    enabled_optional_apis=getattr(self, '_enabled_optional_apis', None)
-                )
-                
-                # Generate tagged output
-                tagged_output = self.enhanced_parser.generate_tagged_output(parsed_ref, index)
-                
-                # Track changes from validation
-                changes_made = self._track_changes(reference, parsed_ref)
-                
-                # Prioritize full_names from API if available (preserves complete names with middle names)
-                # Otherwise build from family_names + given_names
-                full_names = parsed_ref.get("full_names", [])
-                if not full_names or len(full_names) == 0:
-                    full_names = self._build_full_names(parsed_ref)
-                
-                result = {
-                    "index": index,
-                    "original_text": ref_text,
-                    "parser_used": parsed_ref.get("parser_used", "unknown"),
-                    "api_enrichment_used": parsed_ref.get("api_enrichment_used", False),
-                    "enrichment_sources": parsed_ref.get("enrichment_sources", []),
-                    "extracted_fields": {
-                        "family_names": parsed_ref.get("family_names", []),
-                        "given_names": parsed_ref.get("given_names", []),
-                        "full_names": full_names,
-                        "year": parsed_ref.get("year"),
-                        "title": parsed_ref.get("title"),
-                        "journal": parsed_ref.get("journal"),
-                        "volume": parsed_ref.get("volume"),
-                        "doi": parsed_ref.get("doi"),
-                        "pages": parsed_ref.get("pages"),
-                        "publisher": parsed_ref.get("publisher"),
-                        "url": parsed_ref.get("url"),
-                        "abstract": parsed_ref.get("abstract"),
-                        "issue_month": parsed_ref.get("issue_month")
-                    },
-                    "quality_metrics": {
-                        "quality_improvement": parsed_ref.get("quality_improvement", 0),
-                        "final_quality_score": parsed_ref.get("final_quality_score", 0)
-                    },
-                    "missing_fields": parsed_ref.get("missing_fields", []),
-                    "tagged_output": tagged_output,
-                    "flagging_analysis": parsed_ref.get("flagging_analysis", {}),
-                    "comparison_analysis": parsed_ref.get("conflict_analysis", {}),
-                    "doi_metadata": parsed_ref.get("doi_metadata", {}),
-                    "validation_changes": changes_made,  # New: track what changed
-                    "from_cache": False  # Always false since caching is disabled
-                }
-                
-                return result
-                
-            except Exception as e:
-                logger.error(f"❌ Error validating reference {index}: {str(e)}")
-                return {
-                    **reference,
-                    "validation_error": str(e),
-                    "api_enrichment_used": False
-                }
+        try:
+            ref_text = reference.get("original_text", "")
+            if not ref_text:
+                return reference
+            
+            # Positional args keep loguru from formatting per-reference lines that are filtered out
+            logger.info("🔍 Validating reference {}: {:.60}...", index, ref_text)
+            
+            optional_apis = self._enabled_optional_apis
+            cache_key = self._cache_key(ref_text, optional_apis)
+            cached = self._result_cache.get(cache_key)
+            from_cache = cached is not None
+            
+            if from_cache:
+                # Same text and API selection already enriched - reuse it
+                self._result_cache.move_to_end(cache_key)
+                self._cache_hits += 1
+                parsed_ref = deepcopy(cached)
+            else:
+                self._cache_misses += 1
+                # Only the enrichment call holds a concurrency slot; cache hits and the
+                # CPU-only post-processing below run without waiting for one
+                async with self.semaphore:
+                    # Parse with enrichment (mandatory APIs auto-selected, optional APIs user-controlled)
+                    parsed_ref = await asyncio.wait_for(
+                        self.enhanced_parser.parse_reference_enhanced(
+                            ref_text,
+                            enable_api_enrichment=True,
+                            enabled_optional_apis=optional_apis
+                        ),
+                        timeout=_REFERENCE_TIMEOUT
+                    )
+                # Degraded results (enrichment skipped or failed) are not cached, so the
+                # same reference is retried once the APIs recover
+                if self._is_cacheable(parsed_ref):
+                    self._result_cache[cache_key] = deepcopy(parsed_ref)
+                    if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+            
+            # Generate tagged output
+            tagged_output = self.enhanced_parser.generate_tagged_output(parsed_ref, index)
+            
+            # Track changes from validation
+            changes_made = self._track_changes(reference, parsed_ref)
+            
+            # Prioritize full_names from API if available (preserves complete names with middle names)
+            # Otherwise build from family_names + given_names
+            full_names = parsed_ref.get("full_names", [])
+            if not full_names or len(full_names) == 0:
+                full_names = self._build_full_names(parsed_ref)
+            
+            result = {
+                "index": index,
+                "original_text": ref_text,
+                "parser_used": parsed_ref.get("parser_used", "unknown"),
+                "api_enrichment_used": parsed_ref.get("api_enrichment_used", False),
+                "enrichment_sources": parsed_ref.get("enrichment_sources", []),
+                "extracted_fields": {
+                    "family_names": parsed_ref.get("family_names", []),
+                    "given_names": parsed_ref.get("given_names", []),
+                    "full_names": full_names,
+                    "year": parsed_ref.get("year"),
+                    "title": parsed_ref.get("title"),
+                    "journal": parsed_ref.get("journal"),
+                    "volume": parsed_ref.get("volume"),
+                    "doi": parsed_ref.get("doi"),
+                    "pages": parsed_ref.get("pages"),
+                    "publisher": parsed_ref.get("publisher"),
+                    "url": parsed_ref.get("url"),
+                    "abstract": parsed_ref.get("abstract"),
+                    "issue_month": parsed_ref.get("issue_month")
+                },
+                "quality_metrics": {
+                    "quality_improvement": parsed_ref.get("quality_improvement", 0),
+                    "final_quality_score": parsed_ref.get("final_quality_score", 0)
+                },
+                "missing_fields": parsed_ref.get("missing_fields", []),
+                "tagged_output": tagged_output,
+                "flagging_analysis": parsed_ref.get("flagging_analysis", {}),
+                "comparison_analysis": parsed_ref.get("conflict_analysis", {}),
+                "doi_metadata": parsed_ref.get("doi_metadata", {}),
+                "validation_changes": changes_made,  # New: track what changed
+                "from_cache": from_cache
+            }
+            
+            return result
+            
+        except asyncio.TimeoutError:
+            # str() of a TimeoutError is empty, so report the timeout explicitly
+            logger.warning(f"⚠️ Reference {index} timed out after {_REFERENCE_TIMEOUT}s")
+            return {
+                **reference,
+                "validation_error": f"Reference validation timed out after {_REFERENCE_TIMEOUT}s",
+                "api_enrichment_used": False
+            }
+        except Exception as e:
+            logger.error(f"❌ Error validating reference {index}: {str(e)}")
+            return {
+                **reference,
+                "validation_error": str(e),
+                "api_enrichment_used": False
+            }
+    
+    async def _validate_indexed(self, reference: Dict[str, Any], index: int):
+        """Validate one reference for the batch stream, returning (index, reference, result or exception)"""
+        try:
+            result = await self.validate_single_reference(reference, index)
+        except Exception as e:
+            result = e
+        return index, reference, result
     
     async def validate_batch_with_progress(
         self,
@@ -163,12 +230,15 @@ class ValidationService:
         """
         # Filter references based on mode and selection
         refs_to_validate = []
+        # Validation priority per reference index, filled during filtering when possible
+        priorities: Dict[int, int] = {}
         
         if selected_indices is not None:
-            # Validate only selected references
+            # Validate only selected references (set lookup, not a list scan per reference)
+            selected_set = set(selected_indices)
             refs_to_validate = [
                 (i, ref) for i, ref in enumerate(references)
-                if i in selected_indices
+                if i in selected_set
             ]
             logger.info(f"📋 Validating {len(refs_to_validate)} selected references")
         else:
@@ -181,25 +251,21 @@ class ValidationService:
                 ]
                 logger.info(f"⚡ Quick mode: Validating {len(refs_to_validate)} references missing DOI")
             
-            elif mode == "standard":
-                # Validate refs that need enrichment
-                refs_to_validate = [
-                    (i, ref) for i, ref in enumerate(references)
-                    if self.needs_validation(ref.get("extracted_fields", {}))
-                ]
-                logger.info(f"📊 Standard mode: Validating {len(refs_to_validate)} references")
-            
             elif mode == "thorough":
                 # Validate all references
                 refs_to_validate = list(enumerate(references))
                 logger.info(f"🔬 Thorough mode: Validating all {len(refs_to_validate)} references")
             
             else:
-                # Default to standard
-                refs_to_validate = [
-                    (i, ref) for i, ref in enumerate(references)
-                    if self.needs_validation(ref.get("extracted_fields", {}))
-                ]
+                # Standard (also the default): validate refs that need enrichment,
+                # scoring their priority in the same pass over extracted_fields
+                for i, ref in enumerate(references):
+                    extracted = ref.get("extracted_fields") or {}
+                    if self.needs_validation(extracted):
+                        refs_to_validate.append((i, ref))
+                        priorities[i] = self.calculate_priority(extracted)
+                if mode == "standard":
+                    logger.info(f"📊 Standard mode: Validating {len(refs_to_validate)} references")
         
         # Store enabled optional APIs for use during validation (mandatory APIs are auto-selected)
         if selected_apis:
@@ -224,10 +290,10 @@ class ValidationService:
             return
         
         # Sort by priority for better UX
-        refs_to_validate.sort(
-            key=lambda x: self.calculate_priority(x[1].get("extracted_fields", {})),
-            reverse=True
-        )
+        for i, ref in refs_to_validate:
+            if i not in priorities:
+                priorities[i] = self.calculate_priority(ref.get("extracted_fields") or {})
+        refs_to_validate.sort(key=lambda x: priorities[x[0]], reverse=True)
         
         # Initial progress
         yield {
@@ -238,114 +304,37 @@ class ValidationService:
             "message": f"Starting validation of {total_to_validate} references..."
         }
         
-        # Process in batches for better progress updates
-        batch_size = 5
-        validated_results = references.copy()
+        # Every reference gets its own task up front; the semaphore bounds how many
+        # run at once and results stream out in completion order, so one slow
+        # reference no longer holds back the ones that finished before it
+        # Only validated entries are stored; untouched references are merged back at the end
+        validated_updates: Dict[int, Dict[str, Any]] = {}
         validated_count = 0
         enriched_count = 0
-        cached_count = 0  # Always 0 since caching is disabled
+        cached_count = 0
         
-        for batch_start in range(0, total_to_validate, batch_size):
-            try:
-                batch_end = min(batch_start + batch_size, total_to_validate)
-                batch = refs_to_validate[batch_start:batch_end]
-                
-                batch_num = batch_start//batch_size + 1
-                total_batches = (total_to_validate + batch_size - 1) // batch_size
-                logger.info(f"📦 Processing batch {batch_num}/{total_batches}: references {batch_start}-{batch_end-1}")
-                
-                # Process batch in parallel (no timeout - user controls API selection)
-                tasks = [
-                    self.validate_single_reference(ref, idx)
-                    for idx, ref in batch
-                ]
-                
-                logger.debug(f"🔍 Starting asyncio.gather for batch {batch_num} with {len(tasks)} tasks...")
-                # Add timeout to prevent hangs (30s per ref * batch_size, max 180s total)
-                batch_timeout = min(180.0, 30.0 * len(tasks))
+        tasks = [
+            asyncio.create_task(self._validate_indexed(ref, idx))
+            for idx, ref in refs_to_validate
+        ]
+        logger.debug(f"🔍 Scheduled {len(tasks)} validation tasks")
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                idx, original_ref, result = await next_done
                 try:
-                    batch_results = await asyncio.wait_for(
-                        asyncio.gather(*tasks, return_exceptions=True),
-                        timeout=batch_timeout
-                    )
-                    logger.info(f"✅ Batch {batch_num} completed with {len(batch_results)} results")
-                except asyncio.TimeoutError:
-                    logger.warning(f"⚠️ Batch {batch_num} timed out after {batch_timeout}s - some references may be incomplete")
-                    # Create timeout error results for remaining tasks
-                    batch_results = []
-                    for idx, ref in batch:
-                        timeout_result = {
-                            **ref,
-                            "validation_error": f"Batch processing timed out after {batch_timeout}s",
-                            "api_enrichment_used": False
-                        }
-                        batch_results.append(timeout_result)
-                
-                # Update results and count successes
-                for (idx, original_ref), result in zip(batch, batch_results):
-                    try:
-                        if isinstance(result, Exception):
-                            logger.error(f"❌ Error validating reference {idx}: {result}")
-                            # Create error result to keep validation progressing
-                            error_result = {
-                                **original_ref,
-                                "validation_error": str(result),
-                                "api_enrichment_used": False
-                            }
-                            validated_results[idx] = error_result
-                            validated_count += 1  # Count even errors as processed
-                            
-                            # Yield error result
-                            progress = int((validated_count / total_to_validate) * 100)
-                            yield {
-                                "type": "result",
-                                "progress": progress,
-                                "current": validated_count,
-                                "total": total_to_validate,
-                                "index": idx,
-                                "data": error_result,
-                                "message": f"Validated reference {validated_count}/{total_to_validate} (with error)"
-                            }
-                            continue
-                        
-                        # Ensure result is a dict (safety check)
-                        if not isinstance(result, dict):
-                            logger.warning(f"⚠️ Reference {idx} returned non-dict result, converting...")
-                            result = {
-                                **original_ref,
-                                "validation_error": "Invalid result format",
-                                "api_enrichment_used": False
-                            }
-                        
-                        validated_results[idx] = result
-                        validated_count += 1
-                        
-                        # Check if enrichment was used
-                        if result.get("api_enrichment_used"):
-                            enriched_count += 1
-                        
-                        # Yield individual result
-                        progress = int((validated_count / total_to_validate) * 100)
-                        logger.info(f"📊 Progress: {validated_count}/{total_to_validate} references validated ({progress}%)")
-                        yield {
-                            "type": "result",
-                            "progress": progress,
-                            "current": validated_count,
-                            "total": total_to_validate,
-                            "index": idx,
-                            "data": result,
-                            "message": f"Validated reference {validated_count}/{total_to_validate}"
-                        }
-                    except Exception as result_error:
-                        # Even if processing a single result fails, continue
-                        logger.error(f"❌ Error processing result for reference {idx}: {result_error}")
+                    if isinstance(result, Exception):
+                        logger.error(f"❌ Error validating reference {idx}: {result}")
+                        # Create error result to keep validation progressing
                         error_result = {
                             **original_ref,
-                            "validation_error": f"Result processing error: {str(result_error)}",
+                            "validation_error": str(result),
                             "api_enrichment_used": False
                         }
-                        validated_results[idx] = error_result
-                        validated_count += 1
+                        validated_updates[idx] = error_result
+                        validated_count += 1  # Count even errors as processed
+                        
+                        # Yield error result
                         progress = int((validated_count / total_to_validate) * 100)
                         yield {
                             "type": "result",
@@ -356,19 +345,50 @@ class ValidationService:
                             "data": error_result,
                             "message": f"Validated reference {validated_count}/{total_to_validate} (with error)"
                         }
-            except Exception as batch_error:
-                # If entire batch fails, mark all references in batch as errors and continue
-                logger.error(f"❌ Batch {batch_start//batch_size + 1} failed: {batch_error}")
-                # Get batch references that should have been processed
-                batch_end = min(batch_start + batch_size, total_to_validate)
-                failed_batch = refs_to_validate[batch_start:batch_end]
-                for idx, ref in failed_batch:
+                        continue
+                    
+                    # Ensure result is a dict (safety check)
+                    if not isinstance(result, dict):
+                        logger.warning(f"⚠️ Reference {idx} returned non-dict result, converting...")
+                        result = {
+                            **original_ref,
+                            "validation_error": "Invalid result format",
+                            "api_enrichment_used": False
+                        }
+                    
+                    validated_updates[idx] = result
+                    validated_count += 1
+                    
+                    # Check if enrichment was used
+                    if result.get("api_enrichment_used"):
+                        enriched_count += 1
+                    if result.get("from_cache"):
+                        cached_count += 1
+                    
+                    # Yield individual result
+                    progress = int((validated_count / total_to_validate) * 100)
+                    logger.info("📊 Progress: {}/{} references validated ({}%)", validated_count, total_to_validate, progress)
+                    yield {
+                        "type": "result",
+                        "progress": progress,
+                        "current": validated_count,
+                        "total": total_to_validate,
+                        "index": idx,
+                        "data": result,
+                        "message": (
+                            f"Validated reference {validated_count}/{total_to_validate}"
+                            + (" (with error)" if result.get("validation_error") else "")
+                        )
+                    }
+                except Exception as result_error:
+                    # Even if processing a single result fails, continue
+                    logger.error(f"❌ Error processing result for reference {idx}: {result_error}")
                     error_result = {
-                        **ref,
-                        "validation_error": f"Batch processing error: {str(batch_error)}",
+                        **original_ref,
+                        "validation_error": f"Result processing error: {str(result_error)}",
                         "api_enrichment_used": False
                     }
-                    validated_results[idx] = error_result
+                    validated_updates[idx] = error_result
                     validated_count += 1
                     progress = int((validated_count / total_to_validate) * 100)
                     yield {
@@ -378,37 +398,32 @@ class ValidationService:
                         "total": total_to_validate,
                         "index": idx,
                         "data": error_result,
-                        "message": f"Validated reference {validated_count}/{total_to_validate} (batch error)"
+                        "message": f"Validated reference {validated_count}/{total_to_validate} (with error)"
                     }
-        
-        logger.info(f"✅ Completed all batches: {validated_count}/{total_to_validate} references validated")
-        
-        # Cache stats disabled
-        cache_stats = {"hits": 0, "misses": 0, "size": 0}
+        finally:
+            # Stop outstanding work if the client goes away mid-stream
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        logger.info(f"✅ Completed validation: {validated_count}/{total_to_validate} references validated")
+        
+        cache_stats = {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._result_cache)
+        }
         
         # Final complete message - convert dict to array for frontend
-        logger.info(f"📋 Converting {len(validated_results)} results to array format...")
-        results_array = [validated_results[i] for i in range(len(references))]
+        logger.info(f"📋 Converting {len(references)} results to array format...")
+        results_array = [validated_updates.get(i, ref) for i, ref in enumerate(references)]
         
-        # Sanitize results to ensure JSON serializability
-        sanitized_results = []
-        for result in results_array:
-            try:
-                # Deep sanitize the result
-                sanitized = self._sanitize_for_json(result)
-                # Test if it's JSON serializable
-                json.dumps(sanitized, default=str)
-                sanitized_results.append(sanitized)
-            except (TypeError, ValueError) as serialization_error:
-                logger.error(f"Error serializing validation result: {serialization_error}")
-                # Create a safe fallback
-                safe_result = {
-                    "index": result.get("index", 0),
-                    "original_text": str(result.get("original_text", ""))[:500],
-                    "parser_used": result.get("parser_used", "error"),
-                    "error": f"Serialization error: {str(serialization_error)}"
-                }
-                sanitized_results.append(safe_result)
+        # Sanitize results to ensure JSON serializability. Large batches are walked in a
+        # worker thread so other requests' enrichment keeps running on the event loop
+        if len(results_array) > _SANITIZE_IN_THREAD_THRESHOLD:
+            sanitized_results = await asyncio.to_thread(self._sanitize_results, results_array)
+        else:
+            sanitized_results = self._sanitize_results(results_array)
         
         # Build complete event
         complete_event = {
@@ -446,81 +461,43 @@ class ValidationService:
                 "error": "Full results unavailable due to serialization error"
             }
     
-    async def _improve_authors_with_llm(self, parsed_ref: dict, ref_text: str):
-        """
-        Use LLM to improve author extraction during validation
-        This provides high accuracy while keeping parsing fast
-        """
-        try:
-            # Check if Ollama is available
-            response = requests.get("http://localhost:11434/api/tags", timeout=1)
-            if response.status_code != 200:
-                return  # LLM not available, skip
-        except Exception:
-            return  # LLM not available, skip
-        
-        # Only use LLM if authors are missing or look incomplete
-        family_names = parsed_ref.get("family_names", [])
-        if len(family_names) >= 2:  # Already has authors, skip LLM
-            return
-        
-        logger.info(f"🤖 Using LLM to improve author extraction during validation")
-        
-        prompt = f"""Extract ONLY the authors from this academic reference. Return a JSON array of author objects with "given" and "family" names.
-
-Reference: {ref_text}
-
-Return JSON format:
-{{"authors": [{{"given": "First", "family": "Last"}}, ...]}}
-
-IMPORTANT:
-- Extract ALL authors, separated by commas, "and", "&", or semicolons
-- Do NOT include years, dates, or publication info
-- Return ONLY the JSON, no explanation"""
-
-        try:
-            llm_response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": "llama3:latest",
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {"temperature": 0.1}
-                },
-                timeout=15  # Reasonable timeout for validation step
-            )
-            
-            if llm_response.status_code == 200:
-                result = llm_response.json()
-                response_text = result.get("response", "")
-                
-                # Parse JSON response
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if json_match:
-                    authors_data = json.loads(json_match.group())
-                    authors = authors_data.get("authors", [])
-                    
-                    if authors and len(authors) > len(family_names):
-                        # LLM found more authors, use them
-                        parsed_ref["family_names"] = [a.get("family", "") for a in authors]
-                        parsed_ref["given_names"] = [a.get("given", "") for a in authors]
-                        logger.info(f"✅ LLM improved authors: {len(authors)} authors found")
-                        
-        except Exception as e:
-            logger.debug(f"LLM author extraction failed: {e}")
-            # Silently fail, keep original NER results
+    def _sanitize_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sanitize each batch result for JSON, replacing any that fail with a safe stub"""
+        sanitized_results = []
+        for result in results:
+            try:
+                # Deep sanitize the result; its output contains only JSON types, so it is
+                # not serialized here as well - the complete event is checked once by the caller
+                sanitized_results.append(self._sanitize_for_json(result))
+            except (TypeError, ValueError, RecursionError) as serialization_error:
+                logger.error(f"Error serializing validation result: {serialization_error}")
+                # Create a safe fallback
+                safe_result = {
+                    "index": result.get("index", 0),
+                    "original_text": str(result.get("original_text", ""))[:500],
+                    "parser_used": result.get("parser_used", "error"),
+                    "error": f"Serialization error: {str(serialization_error)}"
+                }
+                sanitized_results.append(safe_result)
+        return sanitized_results
     
     def _sanitize_for_json(self, obj: Any) -> Any:
         """Recursively sanitize objects to ensure JSON serializability"""
-        if obj is None:
-            return None
-        elif isinstance(obj, (str, int, float, bool)):
+        # Fast path on the exact type: nearly every node is a plain scalar, dict or list
+        obj_type = type(obj)
+        if obj_type in _JSON_SCALAR_TYPES:
             return obj
-        elif isinstance(obj, dict):
-            return {k: self._sanitize_for_json(v) for k, v in obj.items()}
-        elif isinstance(obj, (list, tuple)):
+        elif obj_type is dict:
+            return {self._sanitize_key(k): self._sanitize_for_json(v) for k, v in obj.items()}
+        elif obj_type is list or obj_type is tuple or obj_type is set:
             return [self._sanitize_for_json(item) for item in obj]
-        elif isinstance(obj, set):
+        
+        # Subclasses (str-based enums, OrderedDict, ...) and unknown types
+        if isinstance(obj, (str, int, float, bool)):
+            return obj
+        elif isinstance(obj, dict):
+            return {self._sanitize_key(k): self._sanitize_for_json(v) for k, v in obj.items()}
+        elif isinstance(obj, (list, tuple, set)):
             return [self._sanitize_for_json(item) for item in obj]
         else:
             # Convert unknown types to string
@@ -529,52 +506,59 @@ IMPORTANT:
             except Exception:
                 return None
     
+    def _sanitize_key(self, key: Any) -> Any:
+        """Keep JSON-compatible dict keys, stringify anything else (json.dumps rejects them)"""
+        return key if type(key) in _JSON_SCALAR_TYPES else str(key)
+    
     def _build_full_names(self, parsed_ref: dict) -> list:
         """Build full names from family_names and given_names"""
         family_names = parsed_ref.get("family_names", [])
         given_names = parsed_ref.get("given_names", [])
         
-        full_names = []
-        for i, family in enumerate(family_names):
-            if i < len(given_names) and given_names[i]:
-                full_names.append(f"{given_names[i]} {family}")
-            else:
-                full_names.append(family)
-        
-        return full_names
+        # Pad given names with "" so every family name gets an entry; extra given names are ignored
+        return [
+            f"{given} {family}" if given else family
+            for family, given in zip(family_names, chain(given_names, repeat("")))
+        ]
+    
+    def _preview_value(self, value: Any) -> str:
+        """Truncate a value for change reports, slicing strings before any copy is made"""
+        if isinstance(value, str):
+            return value[:_CHANGE_PREVIEW_LENGTH]
+        return str(value)[:_CHANGE_PREVIEW_LENGTH]
     
     def _track_changes(self, before: Dict[str, Any], after: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Track what changed during validation"""
         changes = []
         
-        # Fields to check for changes
-        fields_to_check = [
-            "title", "year", "journal", "doi", "pages", 
-            "publisher", "url", "volume", "issue"
-        ]
+        # Fields may live at the top level or under extracted_fields; look that up once
+        before_extracted = before.get("extracted_fields") or {}
         
-        for field in fields_to_check:
-            before_val = before.get(field) or before.get("extracted_fields", {}).get(field)
+        for field in self._FIELDS_TO_CHECK:
             after_val = after.get(field)
+            # Only added or changed values are reported; skip fields validation left empty
+            if not after_val:
+                continue
+            before_val = before.get(field) or before_extracted.get(field)
             
             # Check if value was added or changed
-            if not before_val and after_val:
+            if not before_val:
                 changes.append({
                     "field": field,
                     "type": "added",
                     "before": None,
-                    "after": str(after_val)[:100]  # Limit length
+                    "after": self._preview_value(after_val)
                 })
-            elif before_val != after_val and after_val:
+            elif before_val != after_val:
                 changes.append({
                     "field": field,
                     "type": "updated",
-                    "before": str(before_val)[:100],  # Limit length
-                    "after": str(after_val)[:100]
+                    "before": self._preview_value(before_val),
+                    "after": self._preview_value(after_val)
                 })
         
         # Check authors separately
-        before_family = before.get("family_names") or before.get("extracted_fields", {}).get("family_names", [])
+        before_family = before.get("family_names") or before_extracted.get("family_names", [])
         after_family = after.get("family_names", [])
         
         if not before_family and after_family:
@@ -1,7 +1,11 @@
 import re
 import os
+import hashlib
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -13,36 +17,97 @@ except ImportError:
     DOCX_AVAILABLE = False
     logger.warning("python-docx not available. Word document processing will be disabled.")
 
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+# Worker pool shared by all processors; concurrent uploads overlap docx file I/O
+# instead of queueing behind a private two-thread pool per instance
+WORD_PROC_THREADS = int(os.getenv("WORD_PROC_THREADS", min(32, (os.cpu_count() or 4) * 2)))
+_EXECUTOR = ThreadPoolExecutor(max_workers=WORD_PROC_THREADS, thread_name_prefix="word_proc")
+
+# Extraction results kept for recently seen files, keyed by a hash of their bytes so a
+# re-uploaded paper (saved under a new name) is not parsed again
+_DOCUMENT_CACHE_SIZE = 64
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Reference section headers; each keyword set is one alternation so a line is scanned once
+_REF_KEYWORDS = ('references', 'reference', 'bibliography', 'works cited', 'literature cited', 'citations')
+_REF_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, _REF_KEYWORDS)))
+_SECTION_EXCLUDE_KEYWORDS = (
+    'related works', 'related work', 'literature review', 'background',
+    'introduction', 'methodology', 'conclusion'
+)
+_SECTION_EXCLUDE_PATTERN = re.compile('|'.join(map(re.escape, _SECTION_EXCLUDE_KEYWORDS)))
+# Substring every header match above must contain; lines without it are skipped outright
+_REF_SECTION_HINT_PATTERN = re.compile(r'reference|bibliography|works cited|literature cited|citation')
+_NUMBERED_SECTION_PATTERN = re.compile(r'^\d+[\.\)]\s*(references?|bibliography|citations?)')
+
+# Reference line starts
+_BRACKET_REF_PATTERN = re.compile(r'^\[\d+\]')
+_NUMBERED_REF_PATTERN = re.compile(r'^\d+\.\s*')
+_AUTHOR_YEAR_START_PATTERN = re.compile(r'^[A-Z][a-z]+,\s*[A-Z]\.\s*\(\d{4}\)')
+
+# Section names whose lines are never treated as references
+_EXCLUDE_INDICATORS = (
+    'related works', 'related work', 'literature review', 'background',
+    'introduction', 'methodology', 'conclusion', 'discussion'
+)
+_EXCLUDE_INDICATOR_PATTERN = re.compile('|'.join(map(re.escape, _EXCLUDE_INDICATORS)))
+
+# Unconditional reference hints for the aggressive extractor, fused so a line is
+# scanned once; the named group that matched identifies the hint for logging
+_AGGRESSIVE_REF_PATTERN = re.compile(
+    r'(?P<numbered>^\d+\.)'
+    r'|(?P<author_year>[A-Z][a-z]+,?\s+[A-Z]\.\s*\(\d{4}\))'
+    r'|(?P<doi>(?i:doi:\s*10\.\d+/))'
+    r'|(?P<url>https?://)'
+    r'|(?P<publication>(?i:Journal|Conference|Proceedings|arXiv|IEEE|ACM|Springer))'
+    r'|(?P<volume_page>(?i:vol\.?\s*\d+|pp\.?\s*\d+|\d+\(\d+\)))'
+)
+_AGGRESSIVE_REF_LABELS = {
+    "numbered": "numbered",
+    "author_year": "author-year",
+    "doi": "DOI",
+    "url": "URL",
+    "publication": "publication",
+    "volume_page": "volume/page",
+}
+
+# Loose extractor hints, fused like the aggressive ones; the year hint has its own
+# length condition, so lines too short for it use the pattern without it
+_LOOSE_REF_HINTS = (
+    ("numbered", r'^\d+\.'),
+    ("url", r'https?://'),
+    ("year", r'\b(?:19|20)\d{2}\b'),
+    ("author", r'[A-Z][a-z]+,\s*[A-Z]'),
+)
+_LOOSE_REF_YEAR_PATTERN = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in _LOOSE_REF_HINTS))
+_LOOSE_REF_PATTERN = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _LOOSE_REF_HINTS if name != "year")
+)
+_LOOSE_REF_LABELS = {"numbered": "numbered", "url": "URL", "year": "year-based", "author": "author"}
+
+# Reference hints searched anywhere in a line by the aggressive extractor
+_PUBLICATION_INFO_PATTERN = re.compile(r'published|proceedings|conference|journal|article', re.IGNORECASE)
+_YEAR_PATTERN = re.compile(r'\b(?:19|20)\d{2}\b')
+_REFERENCE_HINT_PATTERN = re.compile(r'[A-Z][a-z]+|doi|journal|conference|proceedings|http', re.IGNORECASE)
+
+# Venue names per paper type, matched as substrings anywhere (so "ieeexplore" counts).
+# The zero-width lookahead tests every position, so one name cannot consume another
+_PAPER_TYPE_PRIORITY = ("ACL", "AAAI", "IEEE")
+_PAPER_TYPE_PATTERN = re.compile(
+    r'(?=(?:'
+    r'(?P<ACL>acl|emnlp|naacl|conll)'
+    r'|(?P<AAAI>aaai|ijcai|icml|iclr|neurips)'
+    r'|(?P<IEEE>ieee|acm|springer)'
+    r'))'
+)
 
 
 class WordDocumentProcessor:
     
     def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=2)
-        self.nlp = None
-        self._load_spacy_model()
-        
-    def _load_spacy_model(self):
-        if not SPACY_AVAILABLE:
-            logger.warning("spaCy not available. Using regex-based processing.")
-            self.nlp = None
-            return
-            
-        try:
-            try:
-                self.nlp = spacy.load("en_core_web_trf")
-                logger.info("Loaded spaCy transformer model")
-            except OSError:
-                self.nlp = spacy.load("en_core_web_sm")
-                logger.info("Loaded spaCy small model")
-        except OSError:
-            logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        self.executor = _EXECUTOR
+        # Filled from executor threads, so access is guarded by a lock
+        self._document_cache: "OrderedDict[str, Tuple[List[Dict[str, Any]], Dict[str, Any]]]" = OrderedDict()
+        self._document_cache_lock = threading.Lock()
     
     async def process_word_document(
         self,
@@ -53,15 +118,9 @@ class WordDocumentProcessor:
             if not DOCX_AVAILABLE:
                 raise Exception("python-docx library not available. Please install it with: pip install python-docx")
             
-            references = await asyncio.get_event_loop().run_in_executor(
+            references, paper_data = await asyncio.get_event_loop().run_in_executor(
                 self.executor,
-                self._extract_references_from_docx,
-                doc_path
-            )
-            
-            paper_data = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                self._extract_paper_metadata,
+                self._extract_document_cached,
                 doc_path
             )
             
@@ -82,19 +141,68 @@ class WordDocumentProcessor:
                 "reference_count": 0
             }
     
-    def _extract_references_from_docx(self, doc_path: str) -> List[Dict[str, Any]]:
+    def _extract_document_cached(self, doc_path: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Extract references and metadata, reusing earlier results for a file with identical bytes"""
+        try:
+            file_hash = hashlib.blake2b()
+            with open(doc_path, "rb") as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                    file_hash.update(chunk)
+            file_key = file_hash.hexdigest()
+        except OSError:
+            # Unreadable file: let extraction report the error as usual
+            return self._extract_document(doc_path)
+        
+        with self._document_cache_lock:
+            cached = self._document_cache.get(file_key)
+            if cached is not None:
+                self._document_cache.move_to_end(file_key)
+        if cached is not None:
+            logger.info(f"Reusing extraction results for previously processed document {file_key[:12]}")
+            return deepcopy(cached)
+        
+        result = self._extract_document(doc_path)
+        with self._document_cache_lock:
+            self._document_cache[file_key] = deepcopy(result)
+            if len(self._document_cache) > _DOCUMENT_CACHE_SIZE:
+                self._document_cache.popitem(last=False)
+        return result
+    
+    def _extract_document(self, doc_path: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Parse the document once and extract both references and paper metadata from it"""
+        try:
+            doc = Document(doc_path)
+            # doc.paragraphs rebuilds its proxy list and .text re-joins runs on every
+            # access, so read each paragraph's text once for both extractors
+            paragraph_texts = [paragraph.text for paragraph in doc.paragraphs]
+        except Exception:
+            # Each extractor retries the open and reports the failure the way it always has
+            doc = paragraph_texts = None
+        
+        return (
+            self._extract_references_from_docx(doc_path, doc, paragraph_texts),
+            self._extract_paper_metadata(doc_path, doc, paragraph_texts)
+        )
+    
+    def _extract_references_from_docx(
+        self,
+        doc_path: str,
+        doc=None,
+        paragraph_texts: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         references = []
         
         try:
-            doc = Document(doc_path)
-            full_text = ""
-            for paragraph in doc.paragraphs:
-                full_text += paragraph.text + "\n"
+            if doc is None:
+                doc = Document(doc_path)
+            if paragraph_texts is None:
+                paragraph_texts = [paragraph.text for paragraph in doc.paragraphs]
+            # Collect pieces and join once instead of re-copying a growing string
+            parts = [f"{text}\n" for text in paragraph_texts]
             for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        full_text += cell.text + " "
-                full_text += "\n"
+                parts.extend(f"{cell.text} " for row in table.rows for cell in row.cells)
+                parts.append("\n")
+            full_text = "".join(parts)
             
             logger.info(f"Word document text extracted: {len(full_text)} characters")
             
@@ -113,44 +221,66 @@ class WordDocumentProcessor:
         """Extract references from text using simplified approach focusing on document end"""
         references = []
         
-        # Split text into lines
-        lines = text.split('\n')
+        # Split text into lines, stripping and lowercasing each line once for every strategy;
+        # lowercasing never adds or removes whitespace, so both lists stay aligned
+        lines = [line.strip() for line in text.split('\n')]
+        lower_lines = [line.strip() for line in text.lower().split('\n')]
         total_lines = len(lines)
         
         logger.info(f"Processing {total_lines} lines from Word document")
         
+        # The tail searches below overlap, so remember the lowest line scanned through to
+        # the end of the document and the first header found from there; a wider search
+        # only has to scan the lines in front of it
+        scanned_from = total_lines
+        scanned_header = None
+        
+        def find_section_from(start: int) -> Optional[int]:
+            nonlocal scanned_from, scanned_header
+            if start < scanned_from:
+                header = self._find_reference_section(lower_lines, start, scanned_from)
+                if header is not None:
+                    scanned_header = header
+                scanned_from = start
+                return scanned_header
+            if scanned_header is None or scanned_header >= start:
+                return scanned_header
+            return self._find_reference_section(lower_lines, start)
+        
+        # Several searches can land on the same header; split its section only once
+        section_references: Dict[int, List[Dict[str, Any]]] = {}
+        
+        def references_from_section(section_start: int) -> List[Dict[str, Any]]:
+            logger.info(f"Found reference section at line {section_start}")
+            if section_start not in section_references:
+                section_references[section_start] = self._extract_references_from_section(
+                    lines[section_start:], lower_lines[section_start:]
+                )
+            return section_references[section_start]
+        
         # Strategy 1: Look for reference section in last 20% of text (or last 1-2 pages)
         search_start = max(0, int(total_lines * 0.8))
         logger.info(f"Searching for references starting from line {search_start} (last 20% of {total_lines} lines)")
         
-        
-        ref_section_start = self._find_reference_section(lines[search_start:])
+        ref_section_start = find_section_from(search_start)
         if ref_section_start is not None:
-            actual_start = search_start + ref_section_start
-            logger.info(f"Found reference section at line {actual_start}")
-            references = self._extract_references_from_section(lines[actual_start:])
+            references = references_from_section(ref_section_start)
         
         if len(references) < 5:
             logger.info(f"  Only found {len(references)} references, expanding search to last 30%")
-            search_start = max(0, int(total_lines * 0.7))
-            ref_section_start = self._find_reference_section(lines[search_start:])
+            ref_section_start = find_section_from(max(0, int(total_lines * 0.7)))
             if ref_section_start is not None:
-                actual_start = search_start + ref_section_start
-                logger.info(f"Found reference section at line {actual_start}")
-                references = self._extract_references_from_section(lines[actual_start:])
+                references = references_from_section(ref_section_start)
         
         if len(references) < 5:
             logger.info(f"  Only found {len(references)} references, trying last 1-2 pages")
-            last_pages_start = max(0, total_lines - 100)
-            ref_section_start = self._find_reference_section(lines[last_pages_start:])
+            ref_section_start = find_section_from(max(0, total_lines - 100))
             if ref_section_start is not None:
-                actual_start = last_pages_start + ref_section_start
-                logger.info(f"Found reference section at line {actual_start}")
-                references = self._extract_references_from_section(lines[actual_start:])
+                references = references_from_section(ref_section_start)
         
         if len(references) < 3:
             logger.info(f"  Only found {len(references)} references, trying numbered reference extraction on entire document")
-            numbered_refs = self._extract_numbered_references(text)
+            numbered_refs = self._extract_numbered_references(lines, lower_lines)
             if numbered_refs:
                 structured_refs = []
                 for ref_text in numbered_refs:
@@ -162,66 +292,57 @@ class WordDocumentProcessor:
         
         if len(references) < 3:
             logger.info(f"  Only found {len(references)} references, searching entire document for reference section")
-            ref_section_start = self._find_reference_section(lines)
+            ref_section_start = find_section_from(0)
             if ref_section_start is not None:
-                logger.info(f"Found reference section at line {ref_section_start}")
-                references = self._extract_references_from_section(lines[ref_section_start:])
+                references = references_from_section(ref_section_start)
         
         if len(references) < 3:
             logger.info(f"  Only found {len(references)} references, trying aggressive pattern matching")
-            references = self._extract_references_aggressive(text)
+            references = self._extract_references_aggressive(lines, lower_lines)
         
         if len(references) < 3:
             logger.info(f"  Only found {len(references)} references, trying very loose pattern matching")
-            references = self._extract_references_loose(text)
+            references = self._extract_references_loose(lines, lower_lines)
         
         logger.info(f" Reference extraction completed: {len(references)} references found")
         return references
     
-    def _find_reference_section(self, lines: List[str]) -> Optional[int]:
-        """Find the start of reference section in given lines"""
-        ref_keywords = ['references', 'reference', 'bibliography', 'works cited', 'literature cited', 'citations']
-        
-        exclude_keywords = ['related works', 'related work', 'literature review', 'background', 'introduction', 'methodology', 'conclusion']
+    def _find_reference_section(self, lower_lines: List[str], start: int = 0, end: Optional[int] = None) -> Optional[int]:
+        """Find the start of reference section in stripped, lowercased lines[start:end], as an index into lines"""
+        if end is None:
+            end = len(lower_lines)
+        logger.info(f" Searching for reference section in {end - start} lines")
         
-        logger.info(f" Searching for reference section in {len(lines)} lines")
-        
-        for i, line in enumerate(lines):
-            line_clean = line.strip().lower()
-            original_line = line.strip()
-            
-            if i < 10:
-                logger.info(f" Line {i}: '{original_line}'")
+        for i in range(start, end):
+            line_clean = lower_lines[i]
             
-            for exclude_keyword in exclude_keywords:
-                if exclude_keyword in line_clean:
-                    logger.info(f"Skipping '{original_line}' - contains exclude keyword: {exclude_keyword}")
-                    continue
+            # Most lines are prose with no header keyword at all; rule them out with one scan
+            if not _REF_SECTION_HINT_PATTERN.search(line_clean):
+                continue
             
-            for keyword in ref_keywords:
-                if (keyword in line_clean and len(line_clean.split()) <= 4) or \
-                   re.match(rf'^{keyword}\s*:?\s*$', line_clean):
-                    logger.info(f" Found reference section header: '{original_line}'")
-                    return i
+            # Logged only; a header keyword on the same line still wins
+            excluded = _SECTION_EXCLUDE_PATTERN.search(line_clean)
+            if excluded:
+                logger.debug("Skipping '{}' - contains exclude keyword: {}", line_clean, excluded.group())
             
-            if re.match(r'^\d+[\.\)]\s*(references?|bibliography|citations?)', line_clean):
-                logger.info(f" Found numbered reference section: '{original_line}'")
+            # A bare "<keyword>:" header line always has four words or fewer, so the
+            # word-count check alone covers it
+            if len(line_clean.split()) <= 4 and _REF_KEYWORD_PATTERN.search(line_clean):
+                logger.info(f" Found reference section header: '{line_clean}'")
                 return i
             
-            if re.match(r'^(reference|references)\s*:?\s*$', line_clean):
-                logger.info(f" Found standalone reference header: '{original_line}'")
+            if _NUMBERED_SECTION_PATTERN.match(line_clean):
+                logger.info(f" Found numbered reference section: '{line_clean}'")
                 return i
         
-        logger.info(f" No reference section found in {len(lines)} lines")
+        logger.info(f" No reference section found in {end - start} lines")
         return None
     
-    def _extract_references_from_section(self, lines: List[str]) -> List[Dict[str, Any]]:
+    def _extract_references_from_section(self, lines: List[str], lower_lines: List[str]) -> List[Dict[str, Any]]:
         """Extract individual references from reference section - SIMPLE SPLITTING ONLY"""
-        full_text = "\n".join(lines)
-        
         logger.info(f" Processing {len(lines)} lines from reference section")
         
-        references = self._extract_references_simple(full_text)
+        references = self._extract_references_simple(lines, lower_lines)
         
         structured_refs = []
         for i, ref_text in enumerate(references):
@@ -232,197 +353,139 @@ class WordDocumentProcessor:
         logger.info(f" Extracted {len(structured_refs)} references")
         return structured_refs
     
-    def _extract_references_simple(self, text: str) -> List[str]:
-        """Simple, reliable reference extraction using regex patterns"""
+    def _extract_references_simple(self, lines: List[str], lower_lines: List[str]) -> List[str]:
+        """Simple, reliable reference extraction using regex patterns over stripped lines"""
         logger.info(" Using simple reference extraction")
         
         references = []
         
-        # Split on bracket references first (most reliable) - handle newlines properly
-        lines = text.split('\n')
-        
+        # Split on bracket references first (most reliable)
         logger.info(f" Processing {len(lines)} lines for bracket references")
         
-        current_ref = ""
-        for line in lines:
-            line = line.strip()
+        # Lines of the reference being built, joined once when it is complete
+        current_parts = []
+        for line, line_lower in zip(lines, lower_lines):
             if not line:
                 continue
             
-            if re.match(r'^\[\d+\]', line):
-                line_lower = line.lower()
+            if _BRACKET_REF_PATTERN.match(line):
                 is_related_work = any(indicator in line_lower for indicator in [
                     'this paper', 'our approach', 'we present', 'we propose'
                 ])
                 
                 if not is_related_work:
-                    if current_ref:
-                        references.append(current_ref.strip())
-                    current_ref = line
-            elif current_ref:
-                current_ref += " " + line
+                    if current_parts:
+                        references.append(" ".join(current_parts))
+                    current_parts = [line]
+            elif current_parts:
+                current_parts.append(line)
             elif len(line) > 20:
-                current_ref = line
+                current_parts = [line]
         
-        if current_ref:
-            references.append(current_ref.strip())
+        if current_parts:
+            references.append(" ".join(current_parts))
         
         logger.info(f" Bracket extraction found {len(references)} references")
         
         if len(references) < 3:
             logger.info("  Few bracket references found, trying numbered references")
-            references = self._extract_numbered_references(text)
+            references = self._extract_numbered_references(lines, lower_lines)
         
         if len(references) < 3:
             logger.info("  Few numbered references found, trying author-year format")
-            references = self._extract_author_year_references(text)
+            references = self._extract_author_year_references(lines)
         
         logger.info(f" Simple extraction found {len(references)} references")
         return references
     
-    def _extract_numbered_references(self, text: str) -> List[str]:
-        """Extract numbered references (1. Author, 2) Author, etc.) - handles newlines properly"""
+    def _extract_numbered_references(self, lines: List[str], lower_lines: List[str]) -> List[str]:
+        """Extract numbered references (1. Author, 2) Author, etc.) from stripped document lines"""
         references = []
         
-        lines = text.split('\n')
-        
         logger.info(f" Processing {len(lines)} lines for numbered references")
         
-        exclude_indicators = [
-            'related works', 'related work', 'literature review', 'background',
-            'introduction', 'methodology', 'conclusion', 'discussion'
-        ]
-        
-        current_ref = ""
-        for line in lines:
-            line = line.strip()
+        current_parts = []
+        for line, line_lower in zip(lines, lower_lines):
             if not line:
                 continue
             
-            line_lower = line.lower()
-            
-            is_related_work = False
-            for indicator in exclude_indicators:
-                if indicator in line_lower:
-                    logger.info(f"Skipping line - contains related work indicator: {line[:100]}...")
-                    is_related_work = True
-                    break
-            
-            if is_related_work:
+            if _EXCLUDE_INDICATOR_PATTERN.search(line_lower):
+                logger.debug("Skipping line - contains related work indicator: {:.100}...", line)
                 continue
             
-            if re.match(r'^\d+\.\s*', line) and not re.match(r'^\[\d+\]', line):
-                if current_ref:
-                    references.append(current_ref.strip())
-                    logger.info(f" Found numbered reference: {current_ref[:100]}...")
-                current_ref = line
-            elif current_ref:
-                current_ref += " " + line
+            if _NUMBERED_REF_PATTERN.match(line) and not _BRACKET_REF_PATTERN.match(line):
+                if current_parts:
+                    references.append(" ".join(current_parts))
+                    logger.debug(" Found numbered reference: {:.100}...", references[-1])
+                current_parts = [line]
+            elif current_parts:
+                current_parts.append(line)
             elif len(line) > 30:
-                if not any(indicator in line_lower for indicator in exclude_indicators):
-                    current_ref = line
+                current_parts = [line]
         
-        if current_ref:
-            references.append(current_ref.strip())
-            logger.info(f" Found final numbered reference: {current_ref[:100]}...")
+        if current_parts:
+            references.append(" ".join(current_parts))
+            logger.debug(" Found final numbered reference: {:.100}...", references[-1])
         
         logger.info(f" Numbered extraction found {len(references)} references")
         return references
     
-    def _extract_author_year_references(self, text: str) -> List[str]:
-        """Extract author-year references (Smith, J. (2020), etc.) - handles newlines properly"""
+    def _extract_author_year_references(self, lines: List[str]) -> List[str]:
+        """Extract author-year references (Smith, J. (2020), etc.) from stripped document lines"""
         references = []
         
-        lines = text.split('\n')
-        
-        current_ref = ""
+        current_parts = []
         for line in lines:
-            line = line.strip()
             if not line:
                 continue
             
-            if re.match(r'^[A-Z][a-z]+,\s*[A-Z]\.\s*\(\d{4}\)', line):
-                if current_ref:
-                    references.append(current_ref.strip())
-                current_ref = line
-            elif current_ref:
-                current_ref += " " + line
+            if _AUTHOR_YEAR_START_PATTERN.match(line):
+                if current_parts:
+                    references.append(" ".join(current_parts))
+                current_parts = [line]
+            elif current_parts:
+                current_parts.append(line)
             elif len(line) > 20:
-                current_ref = line
+                current_parts = [line]
         
-        if current_ref:
-            references.append(current_ref.strip())
+        if current_parts:
+            references.append(" ".join(current_parts))
         
         return references
     
-    def _extract_references_aggressive(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_references_aggressive(self, lines: List[str], lower_lines: List[str]) -> List[Dict[str, Any]]:
         """Aggressive reference extraction that looks for common reference patterns anywhere in the document"""
         references = []
         
         logger.info(" Using aggressive reference extraction")
         
-        lines = text.split('\n')
-        
         # Look for any line that might be a reference based on common patterns
         potential_refs = []
         
-        exclude_indicators = [
-            'related works', 'related work', 'literature review', 'background',
-            'introduction', 'methodology', 'conclusion', 'discussion'
-        ]
-        
-        for line in lines:
-            line = line.strip()
+        for line, line_lower in zip(lines, lower_lines):
             if not line or len(line) < 20:  # Lowered threshold
                 continue
             
-            line_lower = line.lower()
-            
-            is_related_work = False
-            for indicator in exclude_indicators:
-                if indicator in line_lower:
-                    logger.info(f"Skipping potential reference - contains related work indicator: {line[:100]}...")
-                    is_related_work = True
-                    break
-            
-            if is_related_work:
+            if _EXCLUDE_INDICATOR_PATTERN.search(line_lower):
+                logger.debug("Skipping potential reference - contains related work indicator: {:.100}...", line)
                 continue
             
             is_reference = False
             
-            if re.match(r'^\d+\.\s*', line) and not re.match(r'^\[\d+\]', line):
-                is_reference = True
-                logger.info(f" Found numbered reference: {line[:100]}...")
-            
-            elif re.search(r'[A-Z][a-z]+,?\s+[A-Z]\.\s*\(\d{4}\)', line):
+            hint = _AGGRESSIVE_REF_PATTERN.search(line)
+            if hint:
                 is_reference = True
-                logger.info(f" Found author-year reference: {line[:100]}...")
+                logger.debug(" Found {} reference: {:.100}...", _AGGRESSIVE_REF_LABELS[hint.lastgroup], line)
             
-            elif re.search(r'doi:\s*10\.\d+/', line, re.IGNORECASE):
-                is_reference = True
-                logger.info(f"Found DOI reference: {line[:100]}...")
-            
-            elif re.search(r'https?://', line):
-                is_reference = True
-                logger.info(f"Found URL reference: {line[:100]}...")
-            
-            elif re.search(r'Journal|Conference|Proceedings|arXiv|IEEE|ACM|Springer', line, re.IGNORECASE):
-                is_reference = True
-                logger.info(f"Found publication reference: {line[:100]}...")
-            
-            elif re.search(r'vol\.?\s*\d+|pp\.?\s*\d+|\d+\(\d+\)', line, re.IGNORECASE):
-                is_reference = True
-                logger.info(f"Found volume/page reference: {line[:100]}...")
-            
-            elif re.search(r'published|proceedings|conference|journal|article', line, re.IGNORECASE):
+            elif _PUBLICATION_INFO_PATTERN.search(line):
                 if not any(phrase in line_lower for phrase in ['this paper', 'our study', 'we present', 'proposes']):
                     is_reference = True
-                    logger.info(f" Found publication info reference: {line[:100]}...")
+                    logger.debug(" Found publication info reference: {:.100}...", line)
             
-            elif re.search(r'\b(19|20)\d{2}\b', line) and len(line) > 30:  # Lowered threshold
-                if re.search(r'[A-Z][a-z]+|doi|journal|conference|proceedings|http', line, re.IGNORECASE):
+            elif _YEAR_PATTERN.search(line) and len(line) > 30:  # Lowered threshold
+                if _REFERENCE_HINT_PATTERN.search(line):
                     is_reference = True
-                    logger.info(f" Found year-based reference: {line[:100]}...")
+                    logger.debug(" Found year-based reference: {:.100}...", line)
             
             if is_reference:
                 potential_refs.append(line)
@@ -436,48 +499,26 @@ class WordDocumentProcessor:
         
         return references
     
-    def _extract_references_loose(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_references_loose(self, lines: List[str], lower_lines: List[str]) -> List[Dict[str, Any]]:
         """Very loose reference extraction for cases where section headers are removed"""
         references = []
         
         logger.info(" Using very loose reference extraction")
         
-        lines = text.split('\n')
-        
         potential_refs = []
         
-        for line in lines:
-            line = line.strip()
+        for line, line_lower in zip(lines, lower_lines):
             if not line or len(line) < 15:  # Very low threshold
                 continue
             
-            line_lower = line.lower()
-            
-            if any(indicator in line_lower for indicator in [
-                'related works', 'related work', 'literature review', 'background',
-                'introduction', 'methodology', 'conclusion', 'discussion'
-            ]):
+            if _EXCLUDE_INDICATOR_PATTERN.search(line_lower):
                 continue
             
-            is_reference = False
-            
-            if re.match(r'^\d+\.\s*', line):
-                is_reference = True
-                logger.info(f"Found loose numbered reference: {line[:100]}...")
-            
-            elif re.search(r'https?://', line):
-                is_reference = True
-                logger.info(f"Found loose URL reference: {line[:100]}...")
-            
-            elif re.search(r'\b(19|20)\d{2}\b', line) and len(line) > 25:
-                is_reference = True
-                logger.info(f"Found loose year-based reference: {line[:100]}...")
-            
-            elif re.search(r'[A-Z][a-z]+,\s*[A-Z]', line):
-                is_reference = True
-                logger.info(f"Found loose author reference: {line[:100]}...")
-            
-            if is_reference:
+            # Years only count on lines longer than 25 characters
+            hint_pattern = _LOOSE_REF_YEAR_PATTERN if len(line) > 25 else _LOOSE_REF_PATTERN
+            hint = hint_pattern.search(line)
+            if hint:
+                logger.debug("Found loose {} reference: {:.100}...", _LOOSE_REF_LABELS[hint.lastgroup], line)
                 potential_refs.append(line)
         
         logger.info(f"Loose extraction found {len(potential_refs)} potential references")
@@ -489,7 +530,12 @@ class WordDocumentProcessor:
         
         return references
     
-    def _extract_paper_metadata(self, doc_path: str) -> Dict[str, Any]:
+    def _extract_paper_metadata(
+        self,
+        doc_path: str,
+        doc=None,
+        paragraph_texts: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """Extract basic paper metadata from Word document"""
         metadata = {
             "title": "",
@@ -500,12 +546,15 @@ class WordDocumentProcessor:
         }
         
         try:
-            doc = Document(doc_path)
+            if doc is None:
+                doc = Document(doc_path)
+            if paragraph_texts is None:
+                paragraph_texts = [paragraph.text for paragraph in doc.paragraphs]
             
-            metadata["pages"] = len(doc.paragraphs) // 50  # Rough estimate
+            metadata["pages"] = len(paragraph_texts) // 50  # Rough estimate
             
-            for i, paragraph in enumerate(doc.paragraphs[:10]):  # Check first 10 paragraphs
-                text = paragraph.text.strip()
+            for paragraph_text in paragraph_texts[:10]:  # Check first 10 paragraphs
+                text = paragraph_text.strip()
                 
                 if text and not metadata["title"]:
                     if len(text) > 10 and len(text) < 200:
@@ -525,20 +574,12 @@ class WordDocumentProcessor:
         try:
             doc = Document(doc_path)
             
-            text = ""
-            for paragraph in doc.paragraphs[:10]:
-                text += paragraph.text + " "
+            text = "".join(f"{paragraph.text} " for paragraph in doc.paragraphs[:10])
             
-            text_lower = text.lower()
-                
-            if any(conf in text_lower for conf in ['acl', 'emnlp', 'naacl', 'conll']):
-                return "ACL"
-            elif any(conf in text_lower for conf in ['aaai', 'ijcai', 'icml', 'iclr', 'neurips']):
-                return "AAAI"
-            elif any(conf in text_lower for conf in ['ieee', 'acm', 'springer']):
-                return "IEEE"
-            else:
-                return "Generic"
+            # One scan collects every venue family mentioned; the earlier family in
+            # _PAPER_TYPE_PRIORITY still wins when several appear
+            found = {match.lastgroup for match in _PAPER_TYPE_PATTERN.finditer(text.lower())}
+            return next((paper_type for paper_type in _PAPER_TYPE_PRIORITY if paper_type in found), "Generic")
                 
         except Exception as e:
             logger.warning(f"Paper type detection failed: {e}")